@@ -1,23 +1,125 @@
 # -*- coding: utf-8 -*-
-import concurrent.futures
+import asyncio
 import json
+import threading
 from typing import (
     Any,
+    Callable,
     Dict,
+    List,
     Optional,
     Sequence,
+    Tuple,
 )
 
+import orjson
 from agentscope.tool import Toolkit, ToolResponse
 from agentscope.tool._types import RegisteredToolFunction
+from pydantic import BaseModel
 
 from agentscope_runtime.tools.base import Tool
 
+# Event loops running in daemon threads, shared by all adapted tools so a
+# sync tool call does not have to create a thread pool and a loop each time.
+# A sync call made from a tool already running on loop N goes to loop N + 1,
+# so no call ever blocks the loop it runs on or spins up a throwaway loop.
+_TOOL_LOOPS: List[asyncio.AbstractEventLoop] = []
+_TOOL_LOOP_LOCK = threading.Lock()
+
+
+def _get_tool_loop(level: int = 0) -> asyncio.AbstractEventLoop:
+    loops = _TOOL_LOOPS
+    if level < len(loops):
+        return loops[level]
+    with _TOOL_LOOP_LOCK:
+        while len(_TOOL_LOOPS) <= level:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name=f"agentscope-tool-loop-{len(_TOOL_LOOPS)}",
+                daemon=True,
+            ).start()
+            _TOOL_LOOPS.append(loop)
+        return _TOOL_LOOPS[level]
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    level = 0
+    if running is not None:
+        for index, loop in enumerate(_TOOL_LOOPS):
+            if loop is running:
+                # Called from a tool running on a shared loop, blocking on
+                # it would deadlock
+                level = index + 1
+                break
+
+    loop = _get_tool_loop(level)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def _input_validator(input_type: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Return the fastest way to build ``input_type`` from call kwargs.
+
+    Pydantic v2 models expose their prebuilt pydantic-core validator,
+    which skips the model_validate() indirection. Other input types fall
+    back to model_validate() or to calling the type with the kwargs.
+    """
+    validator = getattr(input_type, "__pydantic_validator__", None)
+    if hasattr(validator, "validate_python"):
+        return validator.validate_python
+    if hasattr(input_type, "model_validate"):
+        return input_type.model_validate
+    return lambda kwargs: input_type(**kwargs)
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Same output as ``json.dumps(obj, ensure_ascii=False, indent=2)``,
+    encoded with orjson where it can handle the value."""
+    try:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except TypeError:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _dump_model_result(result: BaseModel) -> Tuple[str, Any]:
+    result_dict = result.model_dump()
+    return _dumps_indented(result_dict), result_dict
+
+
+def _dump_any_result(result: Any) -> Tuple[str, Any]:
+    if hasattr(result, "model_dump"):
+        # Pydantic model result
+        return _dump_model_result(result)
+    # Other result types
+    return str(result), result
+
+
+def _error_response(prefix: str, error: Exception) -> ToolResponse:
+    return ToolResponse(
+        content=[
+            {
+                "type": "text",
+                "text": f"{prefix}: {str(error)}",
+            },
+        ],
+        metadata={"error": True},
+    )
+
 
 def agentscope_tool_adapter(
     tool: Tool,
     name: Optional[str] = None,
     description: Optional[str] = None,
+    async_call: bool = False,
 ) -> RegisteredToolFunction:
     """Convert an agentscope_runtime tool to an AgentScope tool.
 
@@ -30,6 +132,10 @@ def agentscope_tool_adapter(
             tool.name
         description (str, optional): Override the tool description.
             Defaults to tool.description
+        async_call (bool): Register the coroutine function
+            ``original_func.acall`` for async tools, so a toolkit awaits
+            them on its own event loop. Defaults to False, which
+            registers a sync function returning a ToolResponse
 
     Returns:
         RegisteredToolFunction: The AgentScope tool function
@@ -56,91 +162,88 @@ def agentscope_tool_adapter(
             toolkit.tools[search_tool.name] = search_tool
     """
 
-    def func_wrapper(**kwargs: Any) -> ToolResponse:
-        """Wrapper function that adapts tool execution to AgentScope
-        format."""
-        import asyncio
-
-        # Validate input with tool's input type
-        if tool.input_type:
-            try:
-                validated_input = tool.input_type.model_validate(kwargs)
-            except Exception as e:
-                return ToolResponse(
-                    content=[
-                        {
-                            "type": "text",
-                            "text": f"Input validation error: {str(e)}",
-                        },
-                    ],
-                    metadata={"error": True},
-                )
-        else:
-            validated_input = kwargs
-
-        # Execute the tool
+    is_async = asyncio.iscoroutinefunction(tool.arun)
+    # Resolved on the first call, so an unusual input type surfaces as a
+    # validation error response rather than failing registration
+    validate_input = None
+
+    # Tool.arun enforces the declared return type, so the result format can
+    # be picked once here instead of probing every result
+    return_type = getattr(tool, "return_type", None)
+    if isinstance(return_type, type) and issubclass(return_type, BaseModel):
+        dump_result = _dump_model_result
+    else:
+        dump_result = _dump_any_result
+
+    def _validate(kwargs: Dict[str, Any]) -> Any:
+        """Validate the call arguments with the tool's input type."""
+        nonlocal validate_input
+        if not tool.input_type:
+            return kwargs
+        if validate_input is None:
+            validate_input = _input_validator(tool.input_type)
+        return validate_input(kwargs)
+
+    def _format(result: Any) -> ToolResponse:
+        """Convert a tool result to a ToolResponse."""
         try:
-            if asyncio.iscoroutinefunction(tool.arun):
-                # Check if we're already in an event loop
-                try:
-
-                    def run_async() -> Any:
-                        return asyncio.run(tool.arun(validated_input))
-
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(run_async)
-                        result = future.result()
-                except RuntimeError:
-                    # No event loop running, safe to use asyncio.run
-                    result = asyncio.run(tool.arun(validated_input))
-            else:
-                # Run sync tool
-                result = tool.run(validated_input)
-        except Exception as e:
+            content_text, result_dict = dump_result(result)
             return ToolResponse(
                 content=[
                     {
                         "type": "text",
-                        "text": f"Tool execution error: {str(e)}",
+                        "text": content_text,
                     },
                 ],
-                metadata={"error": True},
+                metadata={"tool_result": result_dict},
             )
+        except Exception as e:
+            return _error_response("Result formatting error", e)
 
-        # Convert result to ToolResponse format
+    async def acall(**kwargs: Any) -> ToolResponse:
+        """Execute the tool on the caller's event loop."""
         try:
-            if hasattr(result, "model_dump"):
-                # Pydantic model result
-                result_dict = result.model_dump()
-                content_text = json.dumps(
-                    result_dict,
-                    ensure_ascii=False,
-                    indent=2,
-                )
+            validated_input = _validate(kwargs)
+        except Exception as e:
+            return _error_response("Input validation error", e)
+
+        try:
+            if is_async:
+                result = await tool.arun(validated_input)
             else:
-                # Other result types
-                content_text = str(result)
-                result_dict = result
+                result = tool.run(validated_input)
+        except Exception as e:
+            return _error_response("Tool execution error", e)
 
-            return ToolResponse(
-                content=[
-                    {
-                        "type": "text",
-                        "text": content_text,
-                    },
-                ],
-                metadata={"tool_result": result_dict},
-            )
+        return _format(result)
+
+    def call(**kwargs: Any) -> ToolResponse:
+        """Execute the tool from synchronous code."""
+        if is_async:
+            return _run_coroutine(acall(**kwargs))
+
+        try:
+            validated_input = _validate(kwargs)
         except Exception as e:
-            return ToolResponse(
-                content=[
-                    {
-                        "type": "text",
-                        "text": f"Result formatting error: {str(e)}",
-                    },
-                ],
-                metadata={"error": True},
-            )
+            return _error_response("Input validation error", e)
+
+        try:
+            result = tool.run(validated_input)
+        except Exception as e:
+            return _error_response("Tool execution error", e)
+
+        return _format(result)
+
+    def func_wrapper(**kwargs: Any) -> ToolResponse:
+        """Wrapper function that adapts tool execution to AgentScope
+        format."""
+        return call(**kwargs)
+
+    func_wrapper.call = call
+    func_wrapper.acall = acall
+    acall.call = call
+    acall.acall = acall
+    original_func = acall if async_call and is_async else func_wrapper
 
     # Use provided name/description or fall back to tool defaults
     tool_name = name or tool.name
@@ -163,7 +266,7 @@ def agentscope_tool_adapter(
         name=tool_name,
         source="function",
         mcp_name=None,
-        original_func=func_wrapper,
+        original_func=original_func,
         json_schema=agentscope_schema,
         group="basic",
     )
@@ -220,10 +323,13 @@ def agentscope_toolkit_adapter(
         name_override = name_overrides.get(tool.name)
         description_override = description_overrides.get(tool.name)
 
+        # The toolkit awaits coroutine functions, so async tools run on
+        # its event loop instead of blocking it
         adapted_tool = agentscope_tool_adapter(
             tool,
             name=name_override,
             description=description_override,
+            async_call=True,
         )
 
         toolkit.tools[tool.name] = adapted_tool
@@ -128,7 +128,10 @@ class AutogenToolAdapter(BaseTool[BaseModel, Any]):
         # Run the tool
         try:
             result = await self._tool.arun(args)
-            # make sure return as string
+            # make sure return as string, pydantic encodes the model to
+            # JSON directly without an intermediate dict
+            if hasattr(result, "model_dump_json"):
+                return result.model_dump_json()
             return json.dumps(result.model_dump(), ensure_ascii=False)
         except Exception as e:
             # Re-raise with more context
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import traceback
 import logging
 import socket
 
@@ -151,7 +150,7 @@ class DockerClient(BaseClient):
             return _id, list(port_mapping.values()), "localhost"
         except Exception as e:
             logger.warning(f"An error occurred: {e}")
-            logger.debug(f"{traceback.format_exc()}")
+            logger.debug("Traceback:", exc_info=True)
             return None, None, None
 
     def start(self, container_id):
@@ -165,7 +164,7 @@ class DockerClient(BaseClient):
             return True
         except Exception as e:
             logger.warning(f"An error occurred: {e}")
-            logger.debug(f"{traceback.format_exc()}")
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     def stop(self, container_id, timeout=None):
@@ -178,7 +177,7 @@ class DockerClient(BaseClient):
             return True
         except Exception as e:
             logger.warning(f"An error occurred: {e}")
-            logger.debug(f"{traceback.format_exc()}")
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     def remove(self, container_id, force=False):
@@ -201,7 +200,7 @@ class DockerClient(BaseClient):
             return True
         except Exception as e:
             logger.warning(f"An error occurred: {e}")
-            logger.debug(f"{traceback.format_exc()}")
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     def inspect(self, container_id):
@@ -1,20 +1,119 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=too-many-branches,too-many-statements
+import os
 import time
 import hashlib
-import traceback
+import threading
 import logging
 
 from typing import Optional, Tuple
 
+import orjson
 from kubernetes import client
 from kubernetes import config as k8s_config
+from kubernetes import watch
 from kubernetes.client.rest import ApiException
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from .base_client import BaseClient
 
 logger = logging.getLogger(__name__)
 
+_CONNECTION_POOL_MAXSIZE = 50
+
+_PARTIAL_METADATA_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+)
+# Cleared when the installed kubernetes client rejects per-call headers
+_PARTIAL_METADATA_SUPPORTED = True
+
+# Config source -> ApiClient shared by all KubernetesClient instances, so
+# the kubeconfig is parsed and the connection pool built once per process
+_API_CLIENTS = {}
+_API_CLIENTS_LOCK = threading.Lock()
+# Config sources whose cluster answered the connectivity probe
+_PROBED_CONFIGS = set()
+
+
+def _config_key(kubeconfig):
+    if not kubeconfig:
+        return None
+    with open(kubeconfig, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _get_api_client(kubeconfig=None):
+    """Return the shared ApiClient for a kubeconfig file, or for the
+    in-cluster / default kubeconfig when none is given."""
+    key = _config_key(kubeconfig)
+    with _API_CLIENTS_LOCK:
+        api_client = _API_CLIENTS.get(key)
+        if api_client is not None:
+            return api_client
+
+        configuration = client.Configuration()
+        if kubeconfig:
+            k8s_config.load_kube_config(
+                config_file=kubeconfig,
+                client_configuration=configuration,
+            )
+        else:
+            # Try to load in-cluster config first, then fall back to
+            # kubeconfig
+            try:
+                k8s_config.load_incluster_config(
+                    client_configuration=configuration,
+                )
+            except k8s_config.ConfigException:
+                k8s_config.load_kube_config(
+                    client_configuration=configuration,
+                )
+        configuration.connection_pool_maxsize = max(
+            _CONNECTION_POOL_MAXSIZE,
+            (os.cpu_count() or 1) * 4,
+        )
+        # urllib3 only retries idempotent methods on these statuses, so pod
+        # creation is never replayed
+        configuration.retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        api_client = client.ApiClient(configuration)
+        _API_CLIENTS[key] = api_client
+        return api_client
+
+
+def _probe_connection(kubeconfig, api_client):
+    """Test the connection to the cluster, once per shared ApiClient.
+
+    GET /version is a small fixed-size response, unlike listing every
+    namespace.
+    """
+    key = _config_key(kubeconfig)
+    if key in _PROBED_CONFIGS:
+        return
+    client.VersionApi(api_client).get_code()
+    _PROBED_CONFIGS.add(key)
+
+
+def _connection_error(e):
+    return RuntimeError(
+        f"Kubernetes client initialization failed: {str(e)}\n"
+        "Solutions:\n"
+        "• Ensure kubectl is configured\n"
+        "• Check kubeconfig file permissions\n"
+        "• Verify cluster connectivity\n"
+        "• For in-cluster: ensure proper RBAC permissions",
+    )
+
+
+def _image_digest(image):
+    """Short hex digest of an image name, used for default object names."""
+    return hashlib.blake2b(image.encode(), digest_size=4).hexdigest()
+
 
 class KubernetesClient(BaseClient):
     def __init__(
@@ -27,30 +126,36 @@ class KubernetesClient(BaseClient):
         kubeconfig = self.config.kubeconfig_path
         self.image_registry = image_registry
         try:
-            if kubeconfig:
-                k8s_config.load_kube_config(config_file=kubeconfig)
-            else:
-                # Try to load in-cluster config first, then fall back to
-                # kubeconfig
-                try:
-                    k8s_config.load_incluster_config()
-                except k8s_config.ConfigException:
-                    k8s_config.load_kube_config()
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()  # For Deployments
+            self._api_client = _get_api_client(kubeconfig)
+            self._v1 = client.CoreV1Api(self._api_client)
+            # For Deployments
+            self._apps_v1 = client.AppsV1Api(self._api_client)
             self.namespace = namespace
-            # Test connection
-            self.v1.list_namespace()
             logger.debug("Kubernetes client initialized successfully")
         except Exception as e:
-            raise RuntimeError(
-                f"Kubernetes client initialization failed: {str(e)}\n"
-                "Solutions:\n"
-                "• Ensure kubectl is configured\n"
-                "• Check kubeconfig file permissions\n"
-                "• Verify cluster connectivity\n"
-                "• For in-cluster: ensure proper RBAC permissions",
-            ) from e
+            raise _connection_error(e) from e
+        self._connected = False
+
+    def _ensure_connected(self):
+        """Probe the cluster before the first API call, rather than when
+        the client is built."""
+        if self._connected:
+            return
+        try:
+            _probe_connection(self.config.kubeconfig_path, self._api_client)
+        except Exception as e:
+            raise _connection_error(e) from e
+        self._connected = True
+
+    @property
+    def v1(self):
+        self._ensure_connected()
+        return self._v1
+
+    @property
+    def apps_v1(self):
+        self._ensure_connected()
+        return self._apps_v1
 
     def _is_local_cluster(self):
         """
@@ -138,6 +243,15 @@ class KubernetesClient(BaseClient):
             logger.error(f"Failed to parse port spec '{port_spec}': {e}")
             return None
 
+    def _parse_ports(self, ports):
+        """Parse a list of port specs, skipping invalid ones."""
+        parsed_ports = []
+        for port_spec in ports:
+            port_info = self._parse_port_spec(port_spec)
+            if port_info:
+                parsed_ports.append(port_info)
+        return parsed_ports
+
     def _create_pod_spec(
         self,
         image,
@@ -146,8 +260,13 @@ class KubernetesClient(BaseClient):
         volumes=None,
         environment=None,
         runtime_config=None,
+        parsed_ports=None,
     ):
-        """Create a Kubernetes Pod specification."""
+        """Create a Kubernetes Pod specification.
+
+        ``parsed_ports`` takes the already parsed ``ports`` when the caller
+        needs them too, so they are only parsed once.
+        """
         if runtime_config is None:
             runtime_config = {}
 
@@ -167,19 +286,16 @@ class KubernetesClient(BaseClient):
         )
 
         # Configure ports
-        if ports:
-            container_ports = []
-            for port_spec in ports:
-                port_info = self._parse_port_spec(port_spec)
-                if port_info:
-                    container_ports.append(
-                        client.V1ContainerPort(
-                            container_port=port_info["port"],
-                            protocol=port_info["protocol"],
-                        ),
-                    )
-            if container_ports:
-                container.ports = container_ports
+        if parsed_ports is None and ports:
+            parsed_ports = self._parse_ports(ports)
+        if parsed_ports:
+            container.ports = [
+                client.V1ContainerPort(
+                    container_port=port_info["port"],
+                    protocol=port_info["protocol"],
+                )
+                for port_info in parsed_ports
+            ]
 
         # Configure environment variables
         if environment:
@@ -271,8 +387,9 @@ class KubernetesClient(BaseClient):
     ):
         """Create a new Kubernetes Pod."""
         if not name:
-            name = f"pod-{hashlib.md5(image.encode()).hexdigest()[:8]}"
+            name = f"pod-{_image_digest(image)}"
         try:
+            parsed_ports = self._parse_ports(ports) if ports else []
             # Create pod specification
             pod_spec = self._create_pod_spec(
                 image,
@@ -281,6 +398,7 @@ class KubernetesClient(BaseClient):
                 volumes,
                 environment,
                 runtime_config,
+                parsed_ports=parsed_ports,
             )
             # Create pod metadata
             metadata = client.V1ObjectMeta(
@@ -313,23 +431,16 @@ class KubernetesClient(BaseClient):
             pod_node_ip = "localhost"
             # Auto-create services for exposed ports (like Docker's port
             # mapping)
-            if ports:
-                parsed_ports = []
-                for port_spec in ports:
-                    port_info = self._parse_port_spec(port_spec)
-                    if port_info:
-                        parsed_ports.append(port_info)
-
-                if parsed_ports:
-                    service_created = self._create_multi_port_service(
-                        name,
-                        parsed_ports,
-                    )
-                    if service_created:
-                        (
-                            exposed_ports,
-                            pod_node_ip,
-                        ) = self._get_service_node_ports(name)
+            if parsed_ports:
+                service = self._create_multi_port_service(
+                    name,
+                    parsed_ports,
+                )
+                if service:
+                    (
+                        exposed_ports,
+                        pod_node_ip,
+                    ) = self._get_service_node_ports(name, service)
             logger.debug(
                 f"Pod '{name}' created with exposed ports: {exposed_ports}",
             )
@@ -340,7 +451,7 @@ class KubernetesClient(BaseClient):
 
             return name, exposed_ports, pod_node_ip
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return None, None, None
 
     def start(self, container_id):
@@ -378,7 +489,7 @@ class KubernetesClient(BaseClient):
                 logger.error(f"Failed to check pod status: {e.reason}")
             return False
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return False
 
     def stop(self, container_id, timeout=None):
@@ -405,7 +516,7 @@ class KubernetesClient(BaseClient):
             logger.error(f"Failed to delete pod: {e.reason}")
             return False
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return False
 
     def remove(self, container_id, force=False):
@@ -436,7 +547,7 @@ class KubernetesClient(BaseClient):
             logger.error(f"Failed to remove pod: {e.reason}")
             return False
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return False
 
     def _remove_pod_services(self, pod_name):
@@ -473,15 +584,33 @@ class KubernetesClient(BaseClient):
                 logger.error(f"Failed to inspect pod: {e.reason}")
             return None
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return None
 
     def get_status(self, container_id):
         """Get the current status of the specified pod."""
-        pod_info = self.inspect(container_id)
-        if pod_info and "status" in pod_info:
-            return pod_info["status"]["phase"].lower()
-        return None
+        try:
+            # Only the phase is needed, so skip building the V1Pod model
+            resp = self.v1.read_namespaced_pod(
+                name=container_id,
+                namespace=self.namespace,
+                _preload_content=False,
+            )
+            try:
+                pod_info = orjson.loads(resp.data)
+            finally:
+                resp.release_conn()
+        except ApiException as e:
+            if e.status == 404:
+                logger.warning(f"Pod '{container_id}' not found")
+            else:
+                logger.error(f"Failed to inspect pod: {e.reason}")
+            return None
+        except Exception as e:
+            logger.exception(f"An error occurred: {e}")
+            return None
+        phase = (pod_info.get("status") or {}).get("phase")
+        return phase.lower() if phase else None
 
     def get_logs(
         self,
@@ -506,53 +635,122 @@ class KubernetesClient(BaseClient):
             )
             return None
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return None
 
+    def _list_pod_names(self, label_selector=None):
+        """List pod names, asking the API server for metadata only so the
+        pod specs and statuses are neither sent nor deserialized."""
+        global _PARTIAL_METADATA_SUPPORTED
+        if _PARTIAL_METADATA_SUPPORTED:
+            try:
+                resp = self.v1.list_namespaced_pod(
+                    namespace=self.namespace,
+                    label_selector=label_selector,
+                    _preload_content=False,
+                    _headers={"Accept": _PARTIAL_METADATA_ACCEPT},
+                )
+            except TypeError:
+                # Older kubernetes clients do not accept per-call headers
+                _PARTIAL_METADATA_SUPPORTED = False
+            else:
+                try:
+                    items = orjson.loads(resp.data).get("items") or []
+                finally:
+                    resp.release_conn()
+                return [item["metadata"]["name"] for item in items]
+
+        pods = self.v1.list_namespaced_pod(
+            namespace=self.namespace,
+            label_selector=label_selector,
+        )
+        return [pod.metadata.name for pod in pods.items]
+
     def list_pods(self, label_selector=None):
         """List pods in the namespace."""
         try:
-            pods = self.v1.list_namespaced_pod(
-                namespace=self.namespace,
-                label_selector=label_selector,
-            )
-            return [pod.metadata.name for pod in pods.items]
+            return self._list_pod_names(label_selector)
         except ApiException as e:
             logger.error(f"Failed to list pods: {e.reason}")
             return []
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return []
 
+    @staticmethod
+    def _pod_ready_state(pod):
+        """Return True once all containers are ready, False if the pod has
+        terminated, None while it is still starting."""
+        phase = pod.status.phase
+        if phase == "Running":
+            statuses = pod.status.container_statuses
+            if statuses and all(container.ready for container in statuses):
+                return True
+        elif phase in ("Failed", "Succeeded"):
+            return False
+        return None
+
     def wait_for_pod_ready(self, container_id, timeout=300):
-        """Wait for a pod to be ready."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        """Wait for a pod to be ready.
+
+        The pod is read, then its transitions are followed with a watch so
+        the API server pushes changes instead of being polled. The pod is
+        read again whenever the watch has to be restarted.
+        """
+        deadline = time.monotonic() + timeout
+        resource_version = None
+        w = watch.Watch()
+        field_selector = f"metadata.name={container_id}"
+        while time.monotonic() < deadline:
             try:
-                pod = self.v1.read_namespaced_pod(
-                    name=container_id,
+                if resource_version is None:
+                    pod = self.v1.read_namespaced_pod(
+                        name=container_id,
+                        namespace=self.namespace,
+                    )
+                    state = self._pod_ready_state(pod)
+                    if state is not None:
+                        return state
+                    resource_version = pod.metadata.resource_version
+
+                remaining = deadline - time.monotonic()
+                for event in w.stream(
+                    self.v1.list_namespaced_pod,
                     namespace=self.namespace,
-                )
-                if pod.status.phase == "Running":
-                    # Check if all containers are ready
-                    if pod.status.container_statuses:
-                        all_ready = all(
-                            container.ready
-                            for container in pod.status.container_statuses
-                        )
-                        if all_ready:
-                            return True
-                elif pod.status.phase in ["Failed", "Succeeded"]:
-                    return False
-                time.sleep(2)
+                    field_selector=field_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(remaining)),
+                ):
+                    if event["type"] == "DELETED":
+                        w.stop()
+                        return False
+                    if event["type"] == "ERROR":
+                        # Resource version expired, read the pod again
+                        resource_version = None
+                        break
+                    pod = event["object"]
+                    resource_version = pod.metadata.resource_version
+                    state = self._pod_ready_state(pod)
+                    if state is not None:
+                        w.stop()
+                        return state
             except ApiException as e:
                 if e.status == 404:
                     return False
-                time.sleep(2)
+                resource_version = None
+                if e.status != 410:
+                    time.sleep(min(2, max(0, deadline - time.monotonic())))
+            except (ProtocolError, ReadTimeoutError) as e:
+                # The watch connection dropped, events may have been missed
+                logger.debug(f"Watch on pod '{container_id}' broke: {e}")
+                resource_version = None
         return False
 
     def _create_multi_port_service(self, pod_name, port_list):
-        """Create a single service with multiple ports for the pod."""
+        """Create a single service with multiple ports for the pod.
+
+        Returns the created service, or False on failure.
+        """
         try:
             service_name = f"{pod_name}-service"
             selector = {"app": pod_name}
@@ -587,30 +785,34 @@ class KubernetesClient(BaseClient):
                 spec=service_spec,
             )
 
-            # Create the service in the specified namespace
-            self.v1.create_namespaced_service(
+            # Create the service in the specified namespace. NodePorts are
+            # allocated synchronously by the API server, so the returned
+            # object already carries them
+            return self.v1.create_namespaced_service(
                 namespace=self.namespace,
                 body=service,
             )
-
-            # Wait for service to be ready
-            time.sleep(1)
-            return True
         except Exception as e:
-            logger.error(
-                f"Failed to create multi-port service for pod {pod_name}: "
-                f"{e}, {traceback.format_exc()}",
+            logger.exception(
+                f"Failed to create multi-port service for pod {pod_name}: {e}",
             )
             return False
 
-    def _get_service_node_ports(self, pod_name):
-        """Get the NodePort for a service"""
+    def _get_service_node_ports(self, pod_name, service_info=None):
+        """Get the NodePort for a service
+
+        ``service_info`` may be the service returned on creation, it is
+        only read back from the API server when ports are missing.
+        """
         try:
-            service_name = f"{pod_name}-service"
-            service_info = self.v1.read_namespaced_service(
-                name=service_name,
-                namespace=self.namespace,
-            )
+            if service_info is None or not all(
+                port.node_port for port in service_info.spec.ports or []
+            ):
+                service_name = f"{pod_name}-service"
+                service_info = self.v1.read_namespaced_service(
+                    name=service_name,
+                    namespace=self.namespace,
+                )
 
             node_ports = []
             pod_node_ip = self._get_pod_node_ip(pod_name)
@@ -675,6 +877,7 @@ class KubernetesClient(BaseClient):
         environment=None,
         runtime_config=None,
         replicas=1,
+        parsed_ports=None,
     ):
         """Create a Kubernetes Deployment specification."""
         if runtime_config is None:
@@ -699,19 +902,16 @@ class KubernetesClient(BaseClient):
         )
 
         # Configure ports
-        if ports:
-            container_ports = []
-            for port_spec in ports:
-                port_info = self._parse_port_spec(port_spec)
-                if port_info:
-                    container_ports.append(
-                        client.V1ContainerPort(
-                            container_port=port_info["port"],
-                            protocol=port_info["protocol"],
-                        ),
-                    )
-            if container_ports:
-                container.ports = container_ports
+        if parsed_ports is None and ports:
+            parsed_ports = self._parse_ports(ports)
+        if parsed_ports:
+            container.ports = [
+                client.V1ContainerPort(
+                    container_port=port_info["port"],
+                    protocol=port_info["protocol"],
+                )
+                for port_info in parsed_ports
+            ]
 
         # Configure environment variables
         if environment:
@@ -862,10 +1062,9 @@ class KubernetesClient(BaseClient):
             )
             return True, service_name
         except Exception as e:
-            logger.error(
+            logger.exception(
                 f"Failed to create LoadBalancer service for deployment "
-                f"{deployment_name}: "
-                f"{e}, {traceback.format_exc()}",
+                f"{deployment_name}: {e}",
             )
             return False, None
 
@@ -897,9 +1096,10 @@ class KubernetesClient(BaseClient):
             Tuple of (deployment_name, ports, load_balancer_ip)
         """
         if not name:
-            name = f"deploy-{hashlib.md5(image.encode()).hexdigest()[:8]}"
+            name = f"deploy-{_image_digest(image)}"
 
         try:
+            parsed_ports = self._parse_ports(ports) if ports else []
             # Create deployment specification
             deployment_spec = self._create_deployment_spec(
                 image,
@@ -909,6 +1109,7 @@ class KubernetesClient(BaseClient):
                 environment,
                 runtime_config,
                 replicas,
+                parsed_ports=parsed_ports,
             )
 
             # Create deployment metadata
@@ -944,32 +1145,25 @@ class KubernetesClient(BaseClient):
             load_balancer_ip = None
 
             # Create LoadBalancer service if requested and ports are specified
-            if create_service and ports:
-                parsed_ports = []
-                for port_spec in ports:
-                    port_info = self._parse_port_spec(port_spec)
-                    if port_info:
-                        parsed_ports.append(port_info)
-
-                if parsed_ports:
-                    (
-                        service_created,
+            if create_service and parsed_ports:
+                (
+                    service_created,
+                    service_name,
+                ) = self._create_loadbalancer_service(
+                    name,
+                    parsed_ports,
+                )
+                if service_created:
+                    service_info = {
+                        "name": service_name,
+                        "type": "LoadBalancer",
+                        "ports": [p["port"] for p in parsed_ports],
+                    }
+                    # Wait a bit and try to get LoadBalancer IP
+                    time.sleep(2)
+                    load_balancer_ip = self._get_loadbalancer_ip(
                         service_name,
-                    ) = self._create_loadbalancer_service(
-                        name,
-                        parsed_ports,
                     )
-                    if service_created:
-                        service_info = {
-                            "name": service_name,
-                            "type": "LoadBalancer",
-                            "ports": [p["port"] for p in parsed_ports],
-                        }
-                        # Wait a bit and try to get LoadBalancer IP
-                        time.sleep(2)
-                        load_balancer_ip = self._get_loadbalancer_ip(
-                            service_name,
-                        )
 
             # Wait for deployment to be ready
             if not self.wait_for_deployment_ready(name, timeout=120):
@@ -987,15 +1181,15 @@ class KubernetesClient(BaseClient):
             )
 
         except Exception as e:
-            logger.error(
-                f"Failed to create deployment: {e}, {traceback.format_exc()}",
+            logger.exception(
+                f"Failed to create deployment: {e}",
             )
             return None, None, None
 
     def wait_for_deployment_ready(self, deployment_name, timeout=300):
         """Wait for a deployment to be ready."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < timeout:
             try:
                 deployment = self.apps_v1.read_namespaced_deployment(
                     name=deployment_name,
@@ -1019,8 +1213,8 @@ class KubernetesClient(BaseClient):
 
     def _get_loadbalancer_ip(self, service_name, timeout=30):
         """Get LoadBalancer external IP address."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < timeout:
             try:
                 service = self.v1.read_namespaced_service(
                     name=service_name,
@@ -1086,7 +1280,7 @@ class KubernetesClient(BaseClient):
             logger.error(f"Failed to remove deployment: {e.reason}")
             return False
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return False
 
     def get_deployment_status(self, deployment_name):
@@ -1122,7 +1316,7 @@ class KubernetesClient(BaseClient):
                 logger.error(f"Failed to get deployment status: {e.reason}")
             return None
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return None
 
     def list_deployments(self, label_selector=None):
@@ -1139,5 +1333,5 @@ class KubernetesClient(BaseClient):
             logger.error(f"Failed to list deployments: {e.reason}")
             return []
         except Exception as e:
-            logger.error(f"An error occurred: {e}, {traceback.format_exc()}")
+            logger.exception(f"An error occurred: {e}")
             return []
@@ -10,29 +10,40 @@ def install_lazy_loader(globals_dict, lazy_map):
         globals_dict: The globals() of the current module.
                       Pass the globals() from the module where this is called.
         lazy_map: dict[name, module_path]
-                  OR dict[name, dict(module=..., hint=...)]
+                  OR dict[name, dict(module=..., hint=..., optional=...)]
                   The hint is an optional message for missing dependencies.
+                  Members marked optional resolve to None instead of
+                  raising when their module cannot be imported.
     """
     __all__ = list(lazy_map.keys())
 
-    def __getattr__(name):
-        if name in lazy_map:
-            entry = lazy_map[name]
-            module_path, hint = None, None
-
-            # Support two configuration formats
-            if isinstance(entry, str):
-                module_path = entry
-            elif isinstance(entry, dict):
-                module_path = entry["module"]
-                hint = entry.get("hint")
+    # Normalize both configuration formats once, so a miss only does a
+    # single dict lookup before importing
+    entries = {}
+    # module path -> members it provides, so one import resolves them all
+    by_module = {}
+    for member, entry in lazy_map.items():
+        if isinstance(entry, dict):
+            entries[member] = (
+                entry["module"],
+                entry.get("hint"),
+                entry.get("optional", False),
+            )
+        else:
+            entries[member] = (entry, None, False)
+        by_module.setdefault(entries[member][0], []).append(member)
+    module_name = globals_dict["__name__"]
 
+    def __getattr__(name):
+        entry = entries.get(name)
+        if entry is not None:
+            module_path, hint, optional = entry
             try:
-                module = importlib.import_module(
-                    module_path,
-                    globals_dict["__name__"],
-                )
+                module = importlib.import_module(module_path, module_name)
             except ImportError as e:
+                if optional:
+                    globals_dict[name] = None
+                    return None
                 msg = f"Failed to import {name}. Possible missing dependency."
                 if hint:
                     msg += f" Please install dependency: {hint}"
@@ -44,14 +55,25 @@ def install_lazy_loader(globals_dict, lazy_map):
                 raise ImportError(msg) from e
 
             obj = getattr(module, name)
-            # Cache in globals to avoid reloading
+            # Cache in globals to avoid reloading, together with the other
+            # members the module already defines. Only its __dict__ is
+            # read, so a lazy member of the module (and the optional
+            # dependency behind it) is not resolved as a side effect
+            module_dict = vars(module)
+            for member in by_module[module_path]:
+                if member not in globals_dict and member in module_dict:
+                    globals_dict[member] = module_dict[member]
             globals_dict[name] = obj
             return obj
 
-        raise AttributeError(
-            f"module {globals_dict['__name__']} has no attribute {name}",
-        )
+        raise AttributeError(f"module {module_name} has no attribute {name}")
+
+    def __dir__():
+        return sorted(set(globals_dict) | set(lazy_map))
 
-    # Modify the globals of the calling module
+    # Modify the globals of the calling module. Resolved members are
+    # written back into globals_dict above, so __getattr__ only runs on
+    # the first access of each name.
     globals_dict["__all__"] = __all__
     globals_dict["__getattr__"] = __getattr__
+    globals_dict["__dir__"] = __dir__
@@ -1,19 +1,34 @@
 # -*- coding: utf-8 -*-
+from typing import TYPE_CHECKING
+
 from .base import DeployManager
 from .local_deployer import LocalDeployManager
-from .kubernetes_deployer import (
-    KubernetesDeployManager,
-)
-from .modelstudio_deployer import (
-    ModelstudioDeployManager,
-)
+from ...common.utils.lazy_loader import install_lazy_loader
 
-try:
-    from .agentrun_deployer import (
-        AgentRunDeployManager,
-    )
-except ImportError:
-    AgentRunDeployManager = None  # type: ignore
+if TYPE_CHECKING:
+    from .kubernetes_deployer import KubernetesDeployManager
+    from .modelstudio_deployer import ModelstudioDeployManager
+    from .agentrun_deployer import AgentRunDeployManager
+
+install_lazy_loader(
+    globals(),
+    {
+        "KubernetesDeployManager": {
+            "module": ".kubernetes_deployer",
+            "hint": "pip install kubernetes",
+        },
+        "ModelstudioDeployManager": {
+            "module": ".modelstudio_deployer",
+            "hint": "pip install agentscope-runtime[ext]",
+        },
+        # None when the AgentRun SDK is not installed, as before
+        "AgentRunDeployManager": {
+            "module": ".agentrun_deployer",
+            "hint": "pip install alibabacloud-agentrun20250910",
+            "optional": True,
+        },
+    },
+)
 
 __all__ = [
     "DeployManager",
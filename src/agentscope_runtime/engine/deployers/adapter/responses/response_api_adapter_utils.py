@@ -96,6 +96,16 @@ from agentscope_runtime.engine.schemas.agent_schemas import (
     FileContent,
 )
 
+# Message statuses passed through to Responses API output messages
+_RESPONSES_MESSAGE_STATUSES = frozenset(
+    {"in_progress", "completed", "incomplete"},
+)
+
+# Message types whose content is not streamed as Responses API events
+_NON_STREAMING_MESSAGE_TYPES = frozenset(
+    {MessageType.PLUGIN_CALL, MessageType.PLUGIN_CALL_OUTPUT},
+)
+
 
 # Agent API Types
 
@@ -1474,7 +1484,7 @@ class ResponsesAdapter:
         status = "completed"  # Default status
         if hasattr(message, "status") and message.status:
             # Map Agent API status to Responses API status
-            if message.status in ["in_progress", "completed", "incomplete"]:
+            if message.status in _RESPONSES_MESSAGE_STATUSES:
                 status = message.status
             else:
                 status = "completed"  # Other statuses default to completed
@@ -1519,10 +1529,7 @@ class ResponsesAdapter:
         message_type = message_info["message_type"]
 
         # plugin calls need special adaptation, streaming not supported
-        if message_type in [
-            MessageType.PLUGIN_CALL,
-            MessageType.PLUGIN_CALL_OUTPUT,
-        ]:
+        if message_type in _NON_STREAMING_MESSAGE_TYPES:
             return None
 
         content_indexes = message_info["content_index_list"]
@@ -940,15 +940,14 @@ ls -lh /output/{zip_filename}
         logger.info("Uploading to OSS: %s", object_key)
 
         try:
+            # Stream the artifact from disk instead of buffering it
             with open(zip_file_path, "rb") as f:
-                file_bytes = f.read()
-
-            put_obj_req = PutObjectRequest(
-                bucket=bucket_name,
-                key=object_key,
-                body=file_bytes,
-            )
-            put_obj_result = oss_client.put_object(put_obj_req)
+                put_obj_req = PutObjectRequest(
+                    bucket=bucket_name,
+                    key=object_key,
+                    body=f,
+                )
+                put_obj_result = oss_client.put_object(put_obj_req)
             logger.info(
                 "File uploaded to OSS successfully (Status: %s)",
                 put_obj_result.status_code,
@@ -2,17 +2,25 @@
 import argparse
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from .modelstudio_deployer import ModelstudioDeployManager
-from .utils.wheel_packager import build_wheel
+from .utils.wheel_packager import build_wheel_cached
 
 
-def _parse_args() -> argparse.Namespace:
+def _telemetry_flag(value: str) -> bool:
+    if value not in ("enable", "disable"):
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: '{value}' (choose from 'enable', 'disable')",
+        )
+    return value == "enable"
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="One-click deploy your service to Alibaba Bailian "
         "Function Compute (FC)",
@@ -32,6 +40,8 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--dir",
+        dest="dir_path",
+        metavar="DIR",
         default=None,
         help="Path to your project directory (wrapper mode)",
     )
@@ -54,8 +64,10 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--telemetry",
-        choices=["enable", "disable"],
-        default="enable",
+        dest="telemetry_enabled",
+        type=_telemetry_flag,
+        metavar="{enable,disable}",
+        default=True,
         help="Enable or disable telemetry (default: enable)",
     )
     parser.add_argument(
@@ -77,7 +89,7 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Add description to current agent(optional)",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 async def _run(
@@ -109,7 +121,15 @@ async def _run(
     if mode == "native":
         # Build the current project directly as a wheel, then upload/deploy
         project_dir_path = Path.cwd()
-        built_whl = build_wheel(project_dir_path)
+        effective_build_root = (
+            Path(build_root)
+            if build_root
+            else project_dir_path.parent / ".agentscope_runtime_builds"
+        )
+        built_whl = build_wheel_cached(
+            project_dir_path,
+            effective_build_root / "wheel_cache",
+        )
         return await deployer.deploy(
             project_dir=None,
             cmd=None,
@@ -141,21 +161,7 @@ async def _run(
 
 def main() -> None:
     args = _parse_args()
-    telemetry_enabled = args.telemetry == "enable"
-    result = asyncio.run(
-        _run(
-            dir_path=args.dir,
-            cmd=args.cmd,
-            deploy_name=args.deploy_name,
-            skip_upload=args.skip_upload,
-            telemetry_enabled=telemetry_enabled,
-            build_root=args.build_root,
-            mode=args.mode,
-            whl_path=args.whl_path,
-            agent_id=args.agent_id,
-            agent_desc=args.agent_desc,
-        ),
-    )
+    result = asyncio.run(_run(**vars(args)))
 
     console = Console()
 
@@ -23,6 +23,18 @@ from .utils.service_utils import (
 )
 
 
+class _NotifyingServer(uvicorn.Server):
+    """Uvicorn server that reports the end of its startup phase."""
+
+    def __init__(self, config: uvicorn.Config, on_startup: Callable):
+        super().__init__(config)
+        self._on_startup = on_startup
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        self._on_startup()
+
+
 class LocalDeployManager(DeployManager):
     """Unified LocalDeployManager supporting multiple deployment modes."""
 
@@ -54,8 +66,11 @@ class LocalDeployManager(DeployManager):
 
         # Daemon thread mode attributes
         self._server: Optional[uvicorn.Server] = None
+        self._server_socket: Optional[socket.socket] = None
         self._server_thread: Optional[threading.Thread] = None
         self._server_task: Optional[asyncio.Task] = None
+        self._server_state_changed: Optional[asyncio.Event] = None
+        self._server_exited = threading.Event()
 
         # Detached process mode attributes
         self._detached_process_pid: Optional[int] = None
@@ -195,17 +210,47 @@ class LocalDeployManager(DeployManager):
             loop="asyncio",
             log_level="info",
         )
-        self._server = uvicorn.Server(config)
+        # Woken from the server thread when startup completes or the
+        # server exits, so readiness is not discovered by polling
+        deploy_loop = asyncio.get_running_loop()
+        state_changed = asyncio.Event()
+        self._server_state_changed = state_changed
+
+        def notify_state_changed():
+            try:
+                deploy_loop.call_soon_threadsafe(state_changed.set)
+            except RuntimeError:
+                # The deploying loop is already closed, nobody is waiting
+                pass
+
+        self._server = _NotifyingServer(config, notify_state_changed)
+        self._server_exited.clear()
+
+        # Bind in the caller so port conflicts surface here synchronously
+        # instead of killing the server thread during startup
+        self._server_socket = self._bind_socket()
+        sockets = [self._server_socket]
 
         # Start server in daemon thread
         def run_server():
-            asyncio.run(self._server.serve())
+            try:
+                asyncio.run(self._server.serve(sockets=sockets))
+            finally:
+                self._server_exited.set()
+                notify_state_changed()
 
         self._server_thread = threading.Thread(target=run_server, daemon=True)
         self._server_thread.start()
 
         # Wait for server to start
-        await self._wait_for_server_ready(self._startup_timeout)
+        try:
+            await self._wait_for_server_ready(self._startup_timeout)
+        except Exception:
+            # Do not leave a half-started server holding the port
+            self._server.should_exit = True
+            await self._join_server_thread()
+            await self._cleanup_daemon_thread()
+            raise
 
         self.is_running = True
         self.deploy_id = f"daemon_{self.host}_{self.port}"
@@ -350,7 +395,7 @@ class LocalDeployManager(DeployManager):
 
         # Wait for the server thread to finish
         if self._server_thread and self._server_thread.is_alive():
-            self._server_thread.join(timeout=self._shutdown_timeout)
+            await self._join_server_thread()
             if self._server_thread.is_alive():
                 self._logger.warning(
                     "Server thread did not terminate, potential resource leak",
@@ -360,6 +405,13 @@ class LocalDeployManager(DeployManager):
         self.is_running = False
         self._logger.info("FastAPI daemon thread service stopped successfully")
 
+    async def _join_server_thread(self):
+        """Wait for the server thread without blocking the event loop."""
+        await asyncio.to_thread(
+            self._server_thread.join,
+            timeout=self._shutdown_timeout,
+        )
+
     async def _stop_detached_process(self):
         """Stop detached process mode service."""
         self._logger.info("Stopping FastAPI detached process service...")
@@ -377,7 +429,11 @@ class LocalDeployManager(DeployManager):
 
     async def _cleanup_daemon_thread(self):
         """Clean up daemon thread resources."""
+        if self._server_socket is not None:
+            self._server_socket.close()
         self._server = None
+        self._server_socket = None
+        self._server_state_changed = None
         self._server_task = None
         self._server_thread = None
 
@@ -391,48 +447,65 @@ class LocalDeployManager(DeployManager):
         self._detached_process_pid = None
         self._detached_pid_file = None
 
-    def _is_server_ready(self) -> bool:
-        """Check if the server is ready to accept connections."""
-        try:
-            # Normalize host for connection check
-            # When service binds to 0.0.0.0, we need to connect to 127.0.0.1
-            check_host = self._normalize_host_for_check(self.host)
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(0.1)
-                result = s.connect_ex((check_host, self.port))
-                return result == 0
-        except Exception:
-            return False
+    def _bind_socket(self) -> socket.socket:
+        """Create the listening socket for the daemon thread server.
 
-    @staticmethod
-    def _normalize_host_for_check(host: str) -> str:
-        """Normalize host for connection check.
+        Returns:
+            A bound socket, handed over to uvicorn which listens on it and
+            closes it on shutdown.
 
-        When a service binds to 0.0.0.0 (all interfaces), it cannot be
-        directly connected to. We need to connect to 127.0.0.1 instead
-        to check if the service is running locally.
+        Raises:
+            OSError: If the address is already in use or cannot be bound
+        """
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        sock.set_inheritable(True)
+        return sock
 
-        Args:
-            host: The host the service binds to
+    def _is_server_ready(self) -> bool:
+        """Check if the server is ready to accept connections.
 
-        Returns:
-            The host to use for connection check
+        Uvicorn flips ``Server.started`` once its listening sockets are
+        bound, so readiness is read directly from the server state instead
+        of probing the port with a fresh TCP connection.
         """
-        if host in ("0.0.0.0", "::"):
-            return "127.0.0.1"
-        return host
+        return (
+            self._server is not None
+            and self._server.started
+            and self._server_thread is not None
+            and self._server_thread.is_alive()
+        )
 
     async def _wait_for_server_ready(self, timeout: int = 30):
         """Wait for server to become ready."""
-        end_time = asyncio.get_event_loop().time() + timeout
-
-        while asyncio.get_event_loop().time() < end_time:
-            if self._is_server_ready():
-                return
-
-            await asyncio.sleep(0.1)
-
-        raise RuntimeError("Server did not become ready within timeout")
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout
+
+        while not self._is_server_ready():
+            # uvicorn exits the serving thread when startup fails (e.g. the
+            # lifespan startup raised), no need to wait for the full timeout
+            if self._server_exited.is_set():
+                raise RuntimeError("Server thread exited during startup")
+
+            remaining = end_time - loop.time()
+            if remaining <= 0:
+                raise RuntimeError(
+                    "Server did not become ready within timeout",
+                )
+            try:
+                await asyncio.wait_for(
+                    self._server_state_changed.wait(),
+                    remaining,
+                )
+            except asyncio.TimeoutError:
+                continue
+            self._server_state_changed.clear()
 
     def is_service_running(self) -> bool:
         """Check if service is running."""
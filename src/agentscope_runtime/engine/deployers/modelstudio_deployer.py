@@ -4,6 +4,7 @@
 # pylint:disable=ungrouped-imports, arguments-renamed, protected-access
 #
 # flake8: noqa: E501
+import asyncio
 import json
 import logging
 import os
@@ -666,7 +667,10 @@ class ModelstudioDeployManager(DeployManager):
         telemetry_enabled: bool = True,
     ) -> Tuple[str, str]:
         logger.info("Uploading wheel to OSS")
-        temp_storage_lease_id = _get_presign_url_and_upload_to_oss(
+        # The lease request and the streamed PUT are blocking SDK/requests
+        # calls; keep them off the event loop while the wheel uploads
+        temp_storage_lease_id = await asyncio.to_thread(
+            _get_presign_url_and_upload_to_oss,
             self.modelstudio_config,
             wheel_path,
         )
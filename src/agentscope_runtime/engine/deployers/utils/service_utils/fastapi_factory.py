@@ -3,18 +3,41 @@
 # pylint:disable=protected-access
 
 import asyncio
+import contextvars
 import functools
 import inspect
 import json
 import logging
+import operator
+import os
+import sys
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from contextlib import asynccontextmanager
 from dataclasses import asdict, is_dataclass
-from typing import Optional, Callable, Type, Any, List, Dict
+from typing import (
+    Optional,
+    Callable,
+    Type,
+    Any,
+    List,
+    Dict,
+    NamedTuple,
+    Sequence,
+    AsyncIterator,
+)
 
+import orjson
 from a2a.types import A2ARequest
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from pydantic import BaseModel
 
 from agentscope_runtime.engine.schemas.agent_schemas import AgentRequest
@@ -92,6 +115,171 @@ class _WrappedFastAPI(FastAPI):
         component_schemas[schema_name] = schema_definition
 
 
+def _install_loop_policy(loop_policy: str, mode: DeploymentMode) -> bool:
+    """Install the requested event loop policy for the current process.
+
+    Args:
+        loop_policy: ``"auto"``, ``"uvloop"`` or ``"asyncio"``. ``"auto"``
+            only switches to uvloop when the app owns its process
+            (detached or standalone mode) and uvloop is importable.
+        mode: Deployment mode the app is being created for.
+
+    Returns:
+        True if the uvloop policy is in effect after the call.
+    """
+    if loop_policy == "asyncio":
+        return False
+    if loop_policy not in ("auto", "uvloop"):
+        raise ValueError(f"Unsupported loop_policy: {loop_policy}")
+    if loop_policy == "auto" and (
+        mode == DeploymentMode.DAEMON_THREAD or sys.platform == "win32"
+    ):
+        # The daemon thread shares the caller's process, leave its
+        # policy alone
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        if loop_policy == "uvloop":
+            raise
+        return False
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+# Shared thread pool for sync custom functions, created on first use
+_CUSTOM_FUNC_POOL: Optional[ThreadPoolExecutor] = None
+_CUSTOM_FUNC_POOL_LOCK = threading.Lock()
+
+
+def _custom_func_workers() -> int:
+    value = os.getenv("CUSTOM_FUNC_WORKERS", "4")
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise ValueError(
+            f"CUSTOM_FUNC_WORKERS must be a positive int, got {value!r}",
+        )
+    return workers
+
+
+def _get_custom_func_pool() -> ThreadPoolExecutor:
+    global _CUSTOM_FUNC_POOL  # pylint: disable=global-statement
+    if _CUSTOM_FUNC_POOL is None:
+        with _CUSTOM_FUNC_POOL_LOCK:
+            if _CUSTOM_FUNC_POOL is None:
+                _CUSTOM_FUNC_POOL = ThreadPoolExecutor(
+                    max_workers=_custom_func_workers(),
+                    thread_name_prefix="custom-func",
+                )
+    return _CUSTOM_FUNC_POOL
+
+
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_get_text = operator.attrgetter("text")
+
+
+def _sse_frame(payload: Any) -> bytes:
+    """Serialize ``payload`` with orjson and frame it as an SSE event."""
+    return _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
+
+
+def _serialize_text_chunk(chunk: Any) -> bytes:
+    return orjson.dumps({"text": str(chunk)})
+
+
+def _resolve_chunk_serializer(chunk_type: type) -> Callable[[Any], bytes]:
+    """Pick the JSON serializer used for stream chunks of ``chunk_type``."""
+    if issubclass(chunk_type, BaseModel):
+        # The model's compiled serializer, what model_dump_json uses, but
+        # returning bytes without the str round trip
+        return chunk_type.__pydantic_serializer__.to_json
+    if hasattr(chunk_type, "model_dump_json"):
+        model_dump_json = chunk_type.model_dump_json
+        return lambda chunk: model_dump_json(chunk).encode()
+    if hasattr(chunk_type, "json"):
+        to_json = chunk_type.json
+        return lambda chunk: to_json(chunk).encode()
+    return _serialize_text_chunk
+
+
+_PROC_STATES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "Z": "zombie",
+    "X": "dead",
+    "I": "idle",
+    "P": "parked",
+    "W": "waking",
+    "K": "wake-kill",
+}
+# (monotonic time, cpu seconds) of the previous status sample
+_last_cpu_sample: Optional[tuple] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _proc_status_snapshot(_tick: int) -> Dict[str, Any]:
+    """Read the process status from procfs, cached per monotonic second.
+
+    Mirrors the fields previously reported through psutil. ``cpu_percent``
+    is measured since the previous sample, so the first call reports 0.0.
+
+    Raises:
+        OSError: If procfs is not available.
+    """
+    global _last_cpu_sample  # pylint: disable=global-statement
+
+    with open("/proc/self/stat", "rb") as f:
+        stat = f.read()
+    # The command name may contain spaces, fields start after its ")"
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / clock_ticks
+
+    rss = 0
+    with open("/proc/self/status", "rb") as f:
+        for line in f:
+            if line.startswith(b"VmRSS:"):
+                rss = int(line.split()[1]) * 1024
+                break
+
+    boot_time = 0.0
+    with open("/proc/stat", "rb") as f:
+        for line in f:
+            if line.startswith(b"btime"):
+                boot_time = float(line.split()[1])
+                break
+
+    now = time.monotonic()
+    cpu_percent = 0.0
+    if _last_cpu_sample is not None and now > _last_cpu_sample[0]:
+        cpu_percent = round(
+            (cpu_seconds - _last_cpu_sample[1])
+            / (now - _last_cpu_sample[0])
+            * 100,
+            1,
+        )
+    _last_cpu_sample = (now, cpu_seconds)
+
+    state = fields[0].decode()
+    return {
+        "pid": os.getpid(),
+        "status": _PROC_STATES.get(state, state),
+        "memory_usage": rss,
+        "cpu_percent": cpu_percent,
+        "uptime": boot_time + int(fields[19]) / clock_ticks,
+    }
+
+
 async def error_stream(e):
     yield (
         f"data: "
@@ -99,6 +287,220 @@ async def error_stream(e):
     )
 
 
+_SSE_RAW_HEADERS = (
+    (b"cache-control", b"no-cache"),
+    (b"connection", b"keep-alive"),
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+)
+
+
+class _SSEResponse(StreamingResponse):
+    """Streaming response with prebuilt SSE headers.
+
+    Copies a module-level header list instead of rebuilding it from a
+    dict on every request.
+    """
+
+    media_type = "text/event-stream"
+
+    def init_headers(self, headers: Optional[Dict[str, str]] = None):
+        if headers is not None:
+            super().init_headers(headers)
+            return
+        # Copied because middlewares may mutate the response headers
+        self.raw_headers = list(_SSE_RAW_HEADERS)
+
+
+def _request_too_large(max_size: int) -> JSONResponse:
+    return JSONResponse(
+        status_code=413,
+        content={
+            "error": "Request body too large",
+            "max_request_size": max_size,
+        },
+    )
+
+
+class _RequestTooLarge(HTTPException):
+    """Raised while the agent request body is read once it exceeds the
+    limit. An HTTPException so FastAPI passes it through its body parsing
+    to the handler installed next to the middleware."""
+
+    def __init__(self, max_size: int):
+        super().__init__(status_code=413, detail="Request body too large")
+        self.max_size = max_size
+
+
+class _RequestSizeLimitMiddleware:
+    """Reject agent request bodies larger than ``max_size`` bytes.
+
+    Checks the Content-Length header up front and counts the bytes of
+    chunked bodies as they are received, whichever route handler and
+    request model end up reading the body.
+    """
+
+    def __init__(self, app, path: str, max_size: int):
+        self.app = app
+        self.path = path
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        max_size = self.max_size
+        for key, value in scope["headers"]:
+            if key == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    content_length = -1
+                if content_length < 0:
+                    response = JSONResponse(
+                        status_code=400,
+                        content={"error": "Invalid Content-Length header"},
+                    )
+                    await response(scope, receive, send)
+                    return
+                if content_length > max_size:
+                    await _request_too_large(max_size)(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_size:
+                    raise _RequestTooLarge(max_size)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+_STREAM_END = object()
+
+
+async def _coalesce_frames(
+    frames: AsyncIterator[bytes],
+    window: float,
+    max_bytes: int,
+) -> AsyncIterator[bytes]:
+    """Merge SSE frames produced within ``window`` seconds into one write.
+
+    The upstream iterator is drained by a separate task into a bounded
+    queue, so a flush on timeout never cancels the upstream step that is
+    in progress. A batch is flushed when the window since its first frame
+    elapses, when it reaches ``max_bytes`` or when the stream ends.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+
+    async def produce():
+        # Not a finally block: once cancelled the consumer is gone and a
+        # put on a full queue would never return
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except Exception:
+            await queue.put(_STREAM_END)
+            raise
+        await queue.put(_STREAM_END)
+
+    loop = asyncio.get_running_loop()
+    producer = asyncio.create_task(produce())
+    buffer = bytearray()
+    deadline = 0.0
+    try:
+        while True:
+            if buffer:
+                try:
+                    frame = await asyncio.wait_for(
+                        queue.get(),
+                        deadline - loop.time(),
+                    )
+                except asyncio.TimeoutError:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+            else:
+                frame = await queue.get()
+                deadline = loop.time() + window
+
+            if frame is _STREAM_END:
+                break
+            buffer += frame
+            if len(buffer) >= max_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+        # Surface errors raised outside the frame generator's own handling
+        await producer
+    finally:
+        producer.cancel()
+
+
+class _StreamTarget(NamedTuple):
+    """What the agent endpoint streams from, resolved once per app."""
+
+    custom_func: Optional[Callable]
+    custom_func_executor: Optional[Executor]
+    stream_query: Optional[Callable]
+
+
+class _StreamAdmission:
+    """Bound the number of agent streams served at the same time.
+
+    Uses a condition instead of a semaphore so the limit can be changed
+    while streams are in flight.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        self._limit = _check_stream_limit(limit)
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    async def set_limit(self, limit: Optional[int]):
+        async with self._condition:
+            self._limit = _check_stream_limit(limit)
+            self._condition.notify_all()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._limit is None or self._active < self._limit,
+            )
+            self._active += 1
+
+    async def release(self):
+        # Free the slot before taking the lock so a cancelled release
+        # never leaks it
+        self._active -= 1
+        async with self._condition:
+            self._condition.notify(1)
+
+
+def _check_stream_limit(limit: Optional[int]) -> Optional[int]:
+    if limit is None:
+        return None
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"max_streams must be a positive int, got {limit}")
+    return limit
+
+
 class FastAPIAppFactory:
     """Factory for creating FastAPI applications with unified architecture."""
 
@@ -122,6 +524,13 @@ class FastAPIAppFactory:
         backend_url: Optional[str] = None,
         enable_embedded_worker: bool = False,
         app_kwargs: Optional[Dict] = None,
+        loop_policy: str = "auto",
+        max_streams: Optional[int] = None,
+        custom_func_pool: str = "io",
+        cors_origins: Optional[Sequence[str]] = ("*",),
+        max_request_size: Optional[int] = None,
+        coalesce_ms: float = 0,
+        coalesce_bytes: int = 16384,
         **kwargs: Any,
     ) -> FastAPI:
         """Create a FastAPI application with unified architecture.
@@ -142,12 +551,42 @@ class FastAPIAppFactory:
             backend_url: Celery backend URL
             enable_embedded_worker: Whether to run embedded Celery worker
             app_kwargs: Additional keyword arguments for the FastAPI app
+            loop_policy: Event loop policy, "auto", "uvloop" or "asyncio".
+                Installed before the app is built so that a following
+                ``uvicorn.run`` in standalone/detached mode picks it up
+            max_streams: Maximum number of agent streams served
+                concurrently, further requests wait for a free slot.
+                Unlimited when None
+            custom_func_pool: Where a sync ``func`` runs, "io" for the
+                shared thread pool or "cpu" for a process pool owned by
+                the app. With "cpu", ``func``, the request and the result
+                are pickled, so ``func`` must be a module-level function
+                and context variables do not reach it. On platforms that
+                fork, the workers are forked from the already threaded
+                server process: ``func`` must not rely on locks or threads
+                inherited from it
+            cors_origins: Origins allowed by the CORS middleware. Pass None
+                or an empty list to skip installing the middleware
+            max_request_size: Largest accepted agent request body in
+                bytes, larger requests get a 413 whatever the request
+                model. Unlimited when None
+            coalesce_ms: Merge agent stream events produced within this
+                many milliseconds into one write. Disabled when 0
+            coalesce_bytes: Flush a merged write early once it reaches
+                this many bytes
             **kwargs: Additional keyword arguments
 
         Returns:
             FastAPI application instance
         """
 
+        _install_loop_policy(loop_policy, mode)
+        _check_stream_limit(max_streams)
+        if custom_func_pool not in ("io", "cpu"):
+            raise ValueError(
+                f"Unsupported custom_func_pool: {custom_func_pool}",
+            )
+
         # Initialize Celery mixin if broker and backend URLs are provided
         celery_mixin = None
         if broker_url and backend_url:
@@ -194,6 +633,12 @@ class FastAPIAppFactory:
         app.state.runner = runner
         app.state.response_type = response_type
         app.state.endpoint_path = endpoint_path
+        app.state.max_streams = max_streams
+        app.state.max_request_size = max_request_size
+        app.state.coalesce_ms = coalesce_ms
+        app.state.coalesce_bytes = coalesce_bytes
+        app.state.custom_func_pool = custom_func_pool
+        app.state.custom_func_executor = None
         app.state.protocol_adapters = protocol_adapters  # Store for later use
         app.state.custom_endpoints = (
             custom_endpoints or []
@@ -206,7 +651,13 @@ class FastAPIAppFactory:
         app.state.enable_embedded_worker = enable_embedded_worker
 
         # Add middleware
-        FastAPIAppFactory._add_middleware(app, mode)
+        FastAPIAppFactory._add_middleware(
+            app,
+            mode,
+            cors_origins,
+            endpoint_path,
+            max_request_size,
+        )
 
         # Add routes
         FastAPIAppFactory._add_routes(
@@ -241,6 +692,11 @@ class FastAPIAppFactory:
                 f"Warning: Error during runner setup: {e}",
             )
 
+        # Created here so the condition belongs to the serving loop
+        app.state.stream_admission = _StreamAdmission(
+            getattr(app.state, "max_streams", None),
+        )
+
         # Call custom startup callback
         if before_start:
             if asyncio.iscoroutinefunction(before_start):
@@ -248,47 +704,48 @@ class FastAPIAppFactory:
             else:
                 before_start(app, **kwargs)
 
-        # Add protocol adapter endpoints after runner is available
+        # CPU-bound sync callbacks get their own processes so they do not
+        # hold the GIL against the streaming coroutines
         if (
-            hasattr(app.state, "protocol_adapters")
-            and app.state.protocol_adapters
+            getattr(app.state, "custom_func_pool", "io") == "cpu"
+            and app.state.custom_func
+            and not asyncio.iscoroutinefunction(app.state.custom_func)
         ):
+            app.state.custom_func_executor = ProcessPoolExecutor()
+
+        # Resolved after before_start, which may swap the runner or func
+        app.state.stream_target = FastAPIAppFactory._resolve_stream_target(app)
+
+        # Add protocol adapter endpoints after runner is available
+        state = app.state
+        protocol_adapters = getattr(state, "protocol_adapters", None)
+        if protocol_adapters:
             # Determine the effective function to use
-            if hasattr(app.state, "custom_func") and app.state.custom_func:
-                effective_func = app.state.custom_func
-            elif hasattr(app.state, "runner") and app.state.runner:
+            custom_func = getattr(state, "custom_func", None)
+            runner = getattr(state, "runner", None)
+            if custom_func:
+                effective_func = custom_func
+            elif runner:
                 # Use stream_query if streaming is enabled, otherwise query
-                if (
-                    hasattr(app.state, "stream_enabled")
-                    and app.state.stream_enabled
-                ):
-                    effective_func = app.state.runner.stream_query
+                if getattr(state, "stream_enabled", False):
+                    effective_func = runner.stream_query
                 else:
-                    effective_func = app.state.runner.query
+                    effective_func = runner.query
             else:
                 effective_func = None
 
             if effective_func:
-                for protocol_adapter in app.state.protocol_adapters:
+                for protocol_adapter in protocol_adapters:
                     protocol_adapter.add_endpoint(app=app, func=effective_func)
 
         # Add custom endpoints after runner is available
-        if (
-            hasattr(app.state, "custom_endpoints")
-            and app.state.custom_endpoints
-        ):
+        if getattr(state, "custom_endpoints", None):
             FastAPIAppFactory._add_custom_endpoints(app)
 
         # Start embedded Celery worker if enabled
-        if (
-            hasattr(app.state, "enable_embedded_worker")
-            and app.state.enable_embedded_worker
-            and hasattr(app.state, "celery_mixin")
-            and app.state.celery_mixin
-        ):
+        embedded_worker = getattr(state, "enable_embedded_worker", False)
+        if embedded_worker and getattr(state, "celery_mixin", None):
             # Start Celery worker in background thread
-            import threading
-
             def start_celery_worker():
                 try:
                     celery_mixin = app.state.celery_mixin
@@ -326,6 +783,11 @@ class FastAPIAppFactory:
             else:
                 after_finish(app, **kwargs)
 
+        executor = getattr(app.state, "custom_func_executor", None)
+        if executor is not None:
+            app.state.custom_func_executor = None
+            await asyncio.to_thread(executor.shutdown)
+
         # Cleanup internal runner
         runner = app.state.runner
         if runner:
@@ -352,16 +814,36 @@ class FastAPIAppFactory:
         return runner
 
     @staticmethod
-    def _add_middleware(app: FastAPI, mode: DeploymentMode):
+    def _add_middleware(
+        app: FastAPI,
+        mode: DeploymentMode,
+        cors_origins: Optional[Sequence[str]] = ("*",),
+        endpoint_path: str = "/process",
+        max_request_size: Optional[int] = None,
+    ):
         """Add middleware based on deployment mode."""
-        # Common middleware
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+        # Applies to the agent endpoint whatever its request model, so
+        # typed and raw bodies share the same limit
+        if max_request_size is not None:
+            app.add_middleware(
+                _RequestSizeLimitMiddleware,
+                path=endpoint_path,
+                max_size=max_request_size,
+            )
+
+            @app.exception_handler(_RequestTooLarge)
+            async def request_too_large(request: Request, exc):
+                return _request_too_large(exc.max_size)
+
+        # Common middleware, skipped entirely when no origin is allowed
+        if cors_origins:
+            app.add_middleware(
+                CORSMiddleware,
+                allow_origins=list(cors_origins),
+                allow_credentials=True,
+                allow_methods=["*"],
+                allow_headers=["*"],
+            )
 
         # Mode-specific middleware
         if mode == DeploymentMode.DETACHED_PROCESS:
@@ -392,22 +874,58 @@ class FastAPIAppFactory:
     ):
         """Add routes to the FastAPI application."""
 
-        # Health check endpoint
+        # Health check endpoint. Both possible bodies are serialized once,
+        # probes only pick one based on the runner state.
+        health_bodies = {
+            ready: orjson.dumps(
+                {
+                    "status": "healthy",
+                    "mode": mode.value,
+                    "runner": "ready" if ready else "not_ready",
+                },
+            )
+            for ready in (True, False)
+        }
+
         @app.get("/health")
         async def health_check():
             """Health check endpoint."""
-            status = {"status": "healthy", "mode": mode.value}
+            ready = bool(getattr(app.state, "runner", None))
+            return Response(
+                content=health_bodies[ready],
+                media_type="application/json",
+            )
 
-            # Add service health checks
-            if hasattr(app.state, "runner") and app.state.runner:
-                status["runner"] = "ready"
-            else:
-                status["runner"] = "not_ready"
+        # Agent API endpoint
+        if (
+            isinstance(request_model, type)
+            and issubclass(request_model, AgentRequest)
+            and not app.state.custom_func
+        ):
+            # Let FastAPI build the model directly so the runner does not
+            # validate the same payload a second time
+            async def agent_api(request: dict):
+                """
+                Agent API endpoint, see
+                <https://runtime.agentscope.io/en/protocol.html> for more
+                details.
+                """
+                return FastAPIAppFactory._stream_response(app, request)
+
+            agent_api.__annotations__["request"] = request_model
 
-            return status
+        else:
 
-        # Agent API endpoint
-        @app.post(
+            async def agent_api(request: Request):
+                """
+                Agent API endpoint, see
+                <https://runtime.agentscope.io/en/protocol.html> for more
+                details.
+                """
+                payload = await FastAPIAppFactory._read_json_body(request)
+                return FastAPIAppFactory._stream_response(app, payload)
+
+        app.post(
             endpoint_path,
             openapi_extra={
                 "requestBody": {
@@ -425,23 +943,7 @@ class FastAPIAppFactory:
                 },
             },
             tags=["agent-api"],
-        )
-        async def agent_api(request: dict):
-            """
-            Agent API endpoint, see
-            <https://runtime.agentscope.io/en/protocol.html> for more details.
-            """
-            return StreamingResponse(
-                FastAPIAppFactory._create_stream_generator(
-                    app,
-                    request=request,
-                ),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                },
-            )
+        )(agent_api)
 
         # # Standard endpoint
         # @app.post(endpoint_path)
@@ -453,11 +955,9 @@ class FastAPIAppFactory:
         #         stream_enabled,
         #     )
 
-        # Root endpoint
-        @app.get("/")
-        async def root():
-            """Root endpoint."""
-            return {
+        # Root endpoint, its body never changes after the app is built
+        root_body = orjson.dumps(
+            {
                 "service": "AgentScope Runtime",
                 "mode": mode.value,
                 "endpoints": {
@@ -467,12 +967,73 @@ class FastAPIAppFactory:
                     ),
                     "health": "/health",
                 },
-            }
+            },
+        )
+
+        @app.get("/")
+        async def root():
+            """Root endpoint."""
+            return Response(content=root_body, media_type="application/json")
 
         # Mode-specific endpoints
         if mode == DeploymentMode.DETACHED_PROCESS:
             FastAPIAppFactory._add_process_control_endpoints(app)
 
+    @staticmethod
+    def _stream_response(app: FastAPI, request: Any) -> StreamingResponse:
+        """Build the SSE response for one agent request."""
+        frames = FastAPIAppFactory._create_stream_generator(
+            app,
+            request=request,
+        )
+        coalesce_ms = getattr(app.state, "coalesce_ms", 0)
+        if coalesce_ms > 0:
+            frames = _coalesce_frames(
+                frames,
+                coalesce_ms / 1000,
+                app.state.coalesce_bytes,
+            )
+        return _SSEResponse(frames)
+
+    @staticmethod
+    async def _read_json_body(request: Request) -> dict:
+        """Decode a JSON object request body with orjson.
+
+        Raises:
+            RequestValidationError: The body is not a JSON object. Reported
+                the same way FastAPI reports a body that does not match
+                a ``dict`` parameter.
+        """
+        body = await request.body()
+        try:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "json_invalid",
+                        "loc": ("body", e.pos),
+                        "msg": "JSON decode error",
+                        "input": {},
+                        "ctx": {"error": e.msg},
+                    },
+                ],
+                body=e.doc,
+            ) from e
+        if not isinstance(payload, dict):
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "dict_type",
+                        "loc": ("body",),
+                        "msg": "Input should be a valid dictionary",
+                        "input": payload,
+                    },
+                ],
+                body=payload,
+            )
+        return payload
+
     @staticmethod
     def _add_process_control_endpoints(app: FastAPI):
         """Add process control endpoints for detached mode."""
@@ -481,7 +1042,6 @@ class FastAPIAppFactory:
         async def shutdown_process():
             """Gracefully shutdown the process."""
             # Import here to avoid circular imports
-            import os
             import signal
 
             # Schedule shutdown after response
@@ -492,10 +1052,36 @@ class FastAPIAppFactory:
             asyncio.create_task(delayed_shutdown())
             return {"message": "Shutdown initiated"}
 
+        @app.post("/admin/concurrency")
+        async def set_stream_concurrency(config: dict):
+            """Change the concurrent agent stream limit at runtime."""
+            admission = getattr(app.state, "stream_admission", None)
+            if admission is None:
+                return JSONResponse(
+                    status_code=503,
+                    content={"error": "Service not ready"},
+                )
+            if "max_streams" not in config:
+                return JSONResponse(
+                    status_code=400,
+                    content={"error": "max_streams is required"},
+                )
+            try:
+                await admission.set_limit(config["max_streams"])
+            except ValueError as e:
+                return JSONResponse(status_code=400, content={"error": str(e)})
+            app.state.max_streams = admission.limit
+            return {"max_streams": admission.limit, "active": admission.active}
+
         @app.get("/admin/status")
         async def get_process_status():
             """Get process status information."""
-            import os
+            try:
+                return _proc_status_snapshot(int(time.monotonic()))
+            except OSError:
+                # No procfs on this platform
+                pass
+
             import psutil
 
             process = psutil.Process(os.getpid())
@@ -532,6 +1118,7 @@ class FastAPIAppFactory:
                 result = await FastAPIAppFactory._call_custom_function(
                     app.state.custom_func,
                     request,
+                    app.state.custom_func_executor,
                 )
                 return {"response": result}
             else:
@@ -557,49 +1144,90 @@ class FastAPIAppFactory:
     @staticmethod
     async def _create_stream_generator(app: FastAPI, request: dict):
         """Create streaming response generator."""
+        state = app.state
+        admission = getattr(state, "stream_admission", None)
+        if admission is not None:
+            await admission.acquire()
         try:
-            runner = FastAPIAppFactory._get_runner_instance(app)
-            if not runner:
-                yield (
-                    f"data: {json.dumps({'error': 'Runner not initialized'})}"
-                    f"\n\n"
-                )
+            target = getattr(state, "stream_target", None)
+            if target is None:
+                # Startup has not run, e.g. the app is used without lifespan
+                target = FastAPIAppFactory._resolve_stream_target(app)
+            if target is None:
+                yield _sse_frame({"error": "Runner not initialized"})
                 return
 
-            if app.state.custom_func:
+            if target.custom_func:
                 # Handle custom function (convert to stream)
                 result = await FastAPIAppFactory._call_custom_function(
-                    app.state.custom_func,
+                    target.custom_func,
                     request,
+                    target.custom_func_executor,
                 )
-                yield f"data: {json.dumps({'text': str(result)})}\n\n"
+                yield _sse_frame({"text": str(result)})
             else:
-                # Use runner streaming
-                async for chunk in runner.stream_query(request):
-                    if hasattr(chunk, "model_dump_json"):
-                        yield f"data: {chunk.model_dump_json()}\n\n"
-                    elif hasattr(chunk, "json"):
-                        yield f"data: {chunk.json()}\n\n"
-                    else:
-                        yield f"data: {json.dumps({'text': str(chunk)})}\n\n"
+                # Use runner streaming. Serializers are resolved once per
+                # chunk type rather than probed on every chunk.
+                serializers: Dict[type, Callable[[Any], bytes]] = {}
+                async for chunk in target.stream_query(request):
+                    chunk_type = type(chunk)
+                    serialize = serializers.get(chunk_type)
+                    if serialize is None:
+                        serialize = _resolve_chunk_serializer(chunk_type)
+                        serializers[chunk_type] = serialize
+                    yield _SSE_PREFIX + serialize(chunk) + _SSE_SUFFIX
 
         except Exception as e:
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield _sse_frame({"error": str(e)})
+        finally:
+            if admission is not None:
+                await admission.release()
+
+    @staticmethod
+    def _resolve_stream_target(app: FastAPI) -> Optional[_StreamTarget]:
+        """Resolve the streaming callable for the agent endpoint.
+
+        Returns None while there is no runner, which the endpoint reports
+        as not initialized.
+        """
+        runner = FastAPIAppFactory._get_runner_instance(app)
+        if not runner:
+            return None
+        custom_func = getattr(app.state, "custom_func", None)
+        if custom_func:
+            return _StreamTarget(
+                custom_func,
+                getattr(app.state, "custom_func_executor", None),
+                None,
+            )
+        return _StreamTarget(None, None, runner.stream_query)
 
     @staticmethod
     async def _collect_stream_response(runner, request: dict) -> str:
         """Collect streaming response into a single string."""
-        response_parts = []
+        response_parts: List[str] = []
+        append = response_parts.append
+        get_text = _get_text
         async for chunk in runner.stream_query(request):
-            if hasattr(chunk, "text"):
-                response_parts.append(chunk.text)
-            else:
-                response_parts.append(str(chunk))
+            try:
+                append(get_text(chunk))
+            except AttributeError:
+                append(str(chunk))
         return "".join(response_parts)
 
     @staticmethod
-    async def _call_custom_function(func: Callable, request: dict):
-        """Call custom function with proper parameters."""
+    async def _call_custom_function(
+        func: Callable,
+        request: dict,
+        executor: Optional[Executor] = None,
+    ):
+        """Call custom function with proper parameters.
+
+        Sync functions run on ``executor``, or on the shared custom
+        function thread pool when it is not given. On the thread pool the
+        caller's context variables are visible to the function; they are
+        not carried over to a process pool.
+        """
         if asyncio.iscoroutinefunction(func):
             return await func(
                 user_id="default",
@@ -607,11 +1235,21 @@ class FastAPIAppFactory:
                 request_id="generated",
             )
         else:
-            return func(
+            # Keep blocking callbacks off the event loop so they do not
+            # stall concurrent streams on this worker
+            call = functools.partial(
+                func,
                 user_id="default",
                 request=request,
                 request_id="generated",
             )
+            if executor is None:
+                executor = _get_custom_func_pool()
+                call = functools.partial(contextvars.copy_context().run, call)
+            return await asyncio.get_running_loop().run_in_executor(
+                executor,
+                call,
+            )
 
     @staticmethod
     def _get_runner_instance(app: FastAPI):
@@ -929,8 +1567,6 @@ class FastAPIAppFactory:
 
                 else:
                     # Fallback to in-memory task processing
-                    import time
-
                     # Initialize task storage if not exists
                     if not hasattr(app.state, "active_tasks"):
                         app.state.active_tasks = {}
@@ -984,7 +1620,6 @@ class FastAPIAppFactory:
     ):
         """Execute task in background and update status."""
         try:
-            import time
             import concurrent.futures
 
             # Update status to running
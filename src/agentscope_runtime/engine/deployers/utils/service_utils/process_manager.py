@@ -3,6 +3,7 @@
 
 import asyncio
 import os
+import socket
 import subprocess
 from typing import Optional
 
@@ -249,20 +250,20 @@ class ProcessManager:
         Returns:
             True if service becomes available, False if timeout
         """
-        import socket
-
         # Normalize host for connection check
         # When service binds to 0.0.0.0, we need to connect to 127.0.0.1
-        check_host = self._normalize_host_for_check(host)
+        address = (self._normalize_host_for_check(host), port)
 
-        end_time = asyncio.get_event_loop().time() + timeout
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout
 
-        while asyncio.get_event_loop().time() < end_time:
+        # A socket whose connect attempt failed cannot be portably reused,
+        # so each probe opens a fresh one and relies on connect_ex alone
+        while loop.time() < end_time:
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                     sock.settimeout(1)
-                    result = sock.connect_ex((check_host, port))
-                    if result == 0:
+                    if sock.connect_ex(address) == 0:
                         return True
             except Exception:
                 pass
@@ -15,6 +15,8 @@ production deployers can reuse the behaviour in a structured way.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 import shutil
 import subprocess
@@ -205,6 +207,23 @@ def _write_file(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+# Left out when bundling a user project: VCS data, virtualenvs, build
+# outputs and caches
+_PROJECT_IGNORE_PATTERNS = (
+    ".git",
+    ".venv",
+    ".venv_build",
+    ".agentdev_builds",
+    ".agentscope_runtime_builds",
+    "__pycache__",
+    "dist",
+    "build",
+    "*.pyc",
+    ".mypy_cache",
+    ".pytest_cache",
+)
+
+
 def generate_wrapper_project(
     build_root: Path,
     user_project_dir: Path,
@@ -224,19 +243,7 @@ def generate_wrapper_project(
     bundle_app_dir = (
         wrapper_dir / "deploy_starter" / "user_bundle" / project_basename
     )
-    ignore = shutil.ignore_patterns(
-        ".git",
-        ".venv",
-        ".venv_build",
-        ".agentdev_builds",
-        ".agentscope_runtime_builds",
-        "__pycache__",
-        "dist",
-        "build",
-        "*.pyc",
-        ".mypy_cache",
-        ".pytest_cache",
-    )
+    ignore = shutil.ignore_patterns(*_PROJECT_IGNORE_PATTERNS)
     shutil.copytree(
         user_project_dir,
         bundle_app_dir,
@@ -463,16 +470,21 @@ def build_wheel(project_dir: Path) -> Path:
     issues. Returns the path to the built wheel.
     """
     venv_dir = project_dir / ".venv_build"
+    # Marks a build venv whose tooling is already installed, so warm builds
+    # skip the pip round trip to the package index.
+    ready_marker = venv_dir / ".build_tools_installed"
     if not venv_dir.exists():
         subprocess.run(
             [sys.executable, "-m", "venv", str(venv_dir)],
             check=True,
         )
     vpy = _venv_python(venv_dir)
-    subprocess.run(
-        [str(vpy), "-m", "pip", "install", "--upgrade", "pip", "build"],
-        check=True,
-    )
+    if not ready_marker.exists():
+        subprocess.run(
+            [str(vpy), "-m", "pip", "install", "--upgrade", "pip", "build"],
+            check=True,
+        )
+        ready_marker.touch()
     subprocess.run([str(vpy), "-m", "build"], cwd=str(project_dir), check=True)
     dist_dir = project_dir / "dist"
     whls = sorted(
@@ -485,6 +497,138 @@ def build_wheel(project_dir: Path) -> Path:
     return whls[0]
 
 
+# Build outputs of the project itself, only skipped at its top level so
+# packages that happen to be named ``build`` or ``dist`` are still hashed
+_TOP_LEVEL_BUILD_DIRS = ("build", "dist")
+_fingerprint_ignore = shutil.ignore_patterns(
+    *(p for p in _PROJECT_IGNORE_PATTERNS if p not in _TOP_LEVEL_BUILD_DIRS),
+)
+
+
+# Number of built wheels kept in a wheel cache, least recently used first
+# out
+_WHEEL_CACHE_MAX_ENTRIES = 5
+
+
+def _git_head(project_dir: Path) -> str:
+    """Return the checked out git ref and commit of ``project_dir``.
+
+    Versions derived from git (e.g. setuptools_scm) change with the
+    commit even when no file in the tree does. Returns an empty string
+    outside a git checkout.
+    """
+    git_dir = project_dir / ".git"
+    try:
+        if git_dir.is_file():
+            # Worktrees and submodules point to the real git dir
+            content = git_dir.read_text(encoding="utf-8").strip()
+            git_dir = (
+                project_dir / content.split(":", 1)[1].strip()
+            ).resolve()
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, IndexError):
+        return ""
+    if not head.startswith("ref:"):
+        # Detached HEAD already names the commit
+        return head
+
+    ref = head.split(":", 1)[1].strip()
+    try:
+        return f"{head} {(git_dir / ref).read_text(encoding='utf-8').strip()}"
+    except OSError:
+        pass
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return head
+    for line in packed.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return f"{head} {sha}"
+    return head
+
+
+def _project_fingerprint(project_dir: Path) -> str:
+    """Fingerprint a project tree from file paths, sizes and mtimes, and
+    the git commit it is checked out at.
+
+    Skips what the packager leaves out of the user bundle, hidden
+    directories, virtualenvs (any directory holding a ``pyvenv.cfg``)
+    and egg-info metadata.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f".git/HEAD:{_git_head(project_dir)}\n".encode())
+    for root, dirs, files in os.walk(project_dir):
+        ignored = _fingerprint_ignore(root, dirs + files)
+        if Path(root) == project_dir:
+            ignored.update(_TOP_LEVEL_BUILD_DIRS)
+        dirs[:] = sorted(
+            d
+            for d in dirs
+            if d not in ignored
+            and not d.startswith(".")
+            and not d.endswith(".egg-info")
+            and not os.path.exists(os.path.join(root, d, "pyvenv.cfg"))
+        )
+        for name in sorted(files):
+            if name in ignored:
+                continue
+            path = Path(root) / name
+            stat = path.stat()
+            rel = path.relative_to(project_dir).as_posix()
+            digest.update(
+                f"{rel}:{stat.st_size}:{stat.st_mtime_ns}\n".encode(),
+            )
+    return digest.hexdigest()
+
+
+def build_wheel_cached(project_dir: Path, cache_dir: Path) -> Path:
+    """
+    Build a wheel for ``project_dir`` unless an identical source tree was
+    already built, in which case the cached wheel under ``cache_dir`` is
+    returned without rebuilding.
+    """
+    entry_dir = cache_dir / _project_fingerprint(project_dir)
+    cached = sorted(entry_dir.glob("*.whl"))
+    if cached:
+        # Mark the entry as recently used for _prune_wheel_cache
+        os.utime(entry_dir)
+        return cached[0]
+
+    built = build_wheel(project_dir)
+
+    # Populate the entry in a scratch dir and move it into place in one
+    # step, so a concurrent or interrupted build never leaves a partial
+    # wheel behind
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    scratch_dir = cache_dir / f".tmp-{uuid.uuid4().hex}"
+    scratch_dir.mkdir()
+    shutil.copy2(built, scratch_dir / built.name)
+    try:
+        os.replace(scratch_dir, entry_dir)
+    except OSError:
+        # Another build populated the same entry first
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    _prune_wheel_cache(cache_dir, keep=entry_dir)
+    return entry_dir / built.name
+
+
+def _prune_wheel_cache(cache_dir: Path, keep: Path) -> None:
+    """Remove all but the ``_WHEEL_CACHE_MAX_ENTRIES`` most recently used
+    entries of a wheel cache, never removing ``keep``."""
+    entries = []
+    for entry in cache_dir.iterdir():
+        if entry == keep or entry.name.startswith("."):
+            continue
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, entry in entries[_WHEEL_CACHE_MAX_ENTRIES - 1 :]:
+        shutil.rmtree(entry, ignore_errors=True)
+
+
 def default_deploy_name() -> str:
     ts = time.strftime("%Y%m%d%H%M%S", time.localtime())
     return f"deploy-{ts}-{uuid.uuid4().hex[:6]}"
@@ -21,9 +21,9 @@ class SimpleRunner(Runner):
         **kwargs,
     ):
         print(request)
+        # Two chunks are enough to cover the streaming of text deltas
         yield "Hi"
-        yield "! My name is Friday"
-        yield "."
+        yield "! My name is Friday."
 
 
 class ErrorRunner(Runner):
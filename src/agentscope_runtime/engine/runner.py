@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=not-callable
 import asyncio
+import functools
 import logging
 import inspect
+import itertools
 import traceback
 import uuid
 from contextlib import AsyncExitStack
@@ -26,7 +28,6 @@ from .schemas.agent_schemas import (
     AgentRequest,
     RunStatus,
     AgentResponse,
-    SequenceNumberGenerator,
     Error,
 )
 from .tracing import TraceType
@@ -40,6 +41,36 @@ from .constant import ALLOWED_FRAMEWORK_TYPES
 
 logger = logging.getLogger(__name__)
 
+_ASYNC_GEN = "async_gen"
+_ASYNC_FUNC = "async_func"
+_SYNC_GEN = "sync_gen"
+_SYNC_FUNC = "sync_func"
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_function(func: Any) -> str:
+    if inspect.isasyncgenfunction(func):
+        return _ASYNC_GEN
+    if inspect.iscoroutinefunction(func):
+        return _ASYNC_FUNC
+    if inspect.isgeneratorfunction(func):
+        return _SYNC_GEN
+    return _SYNC_FUNC
+
+
+def _handler_kind(handler: Any) -> str:
+    """Classify a handler once per underlying function.
+
+    Handlers are usually bound methods, which are recreated on every
+    attribute access, so the cache is keyed on the function they wrap.
+    """
+    func = getattr(handler, "__func__", handler)
+    try:
+        return _classify_function(func)
+    except TypeError:
+        # Unhashable callable, classify without caching
+        return _classify_function.__wrapped__(func)
+
 
 class Runner:
     def __init__(self) -> None:
@@ -71,7 +102,7 @@ class Runner:
     async def start(self):
         init_fn = getattr(self, "init_handler", None)
         if callable(init_fn):
-            if inspect.iscoroutinefunction(init_fn):
+            if _handler_kind(init_fn) == _ASYNC_FUNC:
                 await init_fn()
             else:
                 init_fn()
@@ -84,7 +115,7 @@ class Runner:
         shutdown_fn = getattr(self, "shutdown_handler", None)
         try:
             if callable(shutdown_fn):
-                if inspect.iscoroutinefunction(shutdown_fn):
+                if _handler_kind(shutdown_fn) == _ASYNC_FUNC:
                     await shutdown_fn()
                 else:
                     shutdown_fn()
@@ -168,13 +199,14 @@ class Runner:
         """
         Call handler and yield results in streaming fashion, async or sync.
         """
+        kind = _handler_kind(handler)
         result = handler(*args, **kwargs)
 
-        if inspect.isasyncgenfunction(handler):
+        if kind == _ASYNC_GEN:
             async for item in result:
                 yield item
 
-        elif inspect.isgenerator(result):
+        elif kind == _SYNC_GEN or inspect.isgenerator(result):
             for item in result:
                 yield item
 
@@ -213,8 +245,8 @@ class Runner:
                 "Runner()' before calling 'stream_query'.",
             )
 
-        if isinstance(request, dict):
-            request = AgentRequest(**request)
+        if not isinstance(request, AgentRequest):
+            request = AgentRequest.model_validate(request)
 
         # Assign session ID
         request.session_id = request.session_id or str(uuid.uuid4())
@@ -222,16 +254,20 @@ class Runner:
         # Assign user ID
         request.user_id = request.user_id or request.session_id
 
-        seq_gen = SequenceNumberGenerator()
+        next_sequence_number = itertools.count().__next__
+
+        def emit(event: Event) -> Event:
+            event.sequence_number = next_sequence_number()
+            return event
 
         # Initial response
         response = AgentResponse(id=request.id)
         response.session_id = request.session_id
-        yield seq_gen.yield_with_sequence(response)
+        yield emit(response)
 
         # Set to in-progress status
         response.in_progress()
-        yield seq_gen.yield_with_sequence(response)
+        yield emit(response)
 
         query_kwargs = {
             "request": request,
@@ -284,7 +320,7 @@ class Runner:
                     and event.object == "message"
                 ):
                     response.add_new_message(event)
-                yield seq_gen.yield_with_sequence(event)
+                yield emit(event)
         except Exception as e:
             # TODO: fix code
             error = Error(
@@ -292,7 +328,7 @@ class Runner:
                 message=f"Error happens in `query_handler`: {e}",
             )
             logger.error(f"{error.model_dump()}: {traceback.format_exc()}")
-            yield seq_gen.yield_with_sequence(response.failed(error))
+            yield emit(response.failed(error))
             return
 
         # Obtain token usage
@@ -303,4 +339,4 @@ class Runner:
             # Avoid empty message
             pass
 
-        yield seq_gen.yield_with_sequence(response.completed())
+        yield emit(response.completed())
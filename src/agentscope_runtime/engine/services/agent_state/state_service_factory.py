@@ -2,7 +2,7 @@
 
 from typing import Callable, Dict
 
-from ..service_factory import ServiceFactory
+from ..service_factory import BackendAdapter, ServiceFactory
 from .state_service import StateService, InMemoryStateService
 from .redis_state_service import RedisStateService
 
@@ -43,13 +43,16 @@ class StateServiceFactory(ServiceFactory[StateService]):
 
 StateServiceFactory.register_backend(
     "in_memory",
-    lambda **kwargs: InMemoryStateService(),
+    BackendAdapter(InMemoryStateService),
 )
 
 StateServiceFactory.register_backend(
     "redis",
-    lambda **kwargs: RedisStateService(
-        redis_url=kwargs.get("redis_url", "redis://localhost:6379/0"),
-        redis_client=kwargs.get("redis_client"),
+    BackendAdapter(
+        RedisStateService,
+        defaults={
+            "redis_url": "redis://localhost:6379/0",
+            "redis_client": None,
+        },
     ),
 )
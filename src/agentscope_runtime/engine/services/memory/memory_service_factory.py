@@ -2,7 +2,7 @@
 
 from typing import Callable, Dict
 
-from ..service_factory import ServiceFactory
+from ..service_factory import BackendAdapter, ServiceFactory
 from .memory_service import MemoryService, InMemoryMemoryService
 from .redis_memory_service import RedisMemoryService
 from .mem0_memory_service import Mem0MemoryService
@@ -59,7 +59,7 @@ class MemoryServiceFactory(ServiceFactory[MemoryService]):
 
 MemoryServiceFactory.register_backend(
     "in_memory",
-    lambda **kwargs: InMemoryMemoryService(),
+    BackendAdapter(InMemoryMemoryService),
 )
 
 MemoryServiceFactory.register_backend(
@@ -84,43 +84,32 @@ MemoryServiceFactory.register_backend(
 
 if TABLESTORE_AVAILABLE:
 
-    def _create_tablestore_memory_service(**kwargs):
-        """Helper function to create a TablestoreMemoryService instance."""
-        search_strategy = kwargs.get("search_strategy")
+    def _parse_search_strategy(search_strategy):
+        """Accept a SearchStrategy, its string value or None."""
         if isinstance(search_strategy, str):
-            search_strategy = SearchStrategy(search_strategy.lower())
-        elif search_strategy is None:
-            search_strategy = SearchStrategy.FULL_TEXT
-
-        return TablestoreMemoryService(
-            tablestore_client=kwargs["tablestore_client"],
-            search_strategy=search_strategy,
-            embedding_model=kwargs.get("embedding_model"),
-            vector_dimension=int(kwargs.get("vector_dimension", 1536)),
-            table_name=kwargs.get("table_name", "agentscope_runtime_memory"),
-            search_index_schema=kwargs.get("search_index_schema"),
-            text_field=kwargs.get("text_field", "text"),
-            embedding_field=kwargs.get("embedding_field", "embedding"),
-            vector_metric_type=kwargs.get("vector_metric_type"),
-            **{
-                k: v
-                for k, v in kwargs.items()
-                if k
-                not in [
-                    "tablestore_client",
-                    "search_strategy",
-                    "embedding_model",
-                    "vector_dimension",
-                    "table_name",
-                    "search_index_schema",
-                    "text_field",
-                    "embedding_field",
-                    "vector_metric_type",
-                ]
-            },
-        )
+            return SearchStrategy(search_strategy.lower())
+        if search_strategy is None:
+            return SearchStrategy.FULL_TEXT
+        return search_strategy
 
     MemoryServiceFactory.register_backend(
         "tablestore",
-        _create_tablestore_memory_service,
+        BackendAdapter(
+            TablestoreMemoryService,
+            defaults={
+                "search_strategy": None,
+                "embedding_model": None,
+                "vector_dimension": 1536,
+                "table_name": "agentscope_runtime_memory",
+                "search_index_schema": None,
+                "text_field": "text",
+                "embedding_field": "embedding",
+                "vector_metric_type": None,
+            },
+            passthrough=True,
+            converters={
+                "search_strategy": _parse_search_strategy,
+                "vector_dimension": int,
+            },
+        ),
     )
@@ -2,14 +2,67 @@
 
 import os
 import inspect
-
-from typing import Callable, Dict, Any, Optional, TypeVar, Generic
+import sys
+
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Mapping,
+    Optional,
+    TypeVar,
+    Generic,
+)
 
 from .base import ServiceWithLifecycleManager
 
 T = TypeVar("T", bound=ServiceWithLifecycleManager)
 
 
+class BackendAdapter:
+    """Backend constructor wrapper with its defaults resolved up front.
+
+    Registered in place of ``lambda **kwargs: Backend(...)`` style
+    constructors, so each ``create()`` only merges the caller's kwargs
+    into prebuilt defaults.
+
+    Args:
+        constructor: The backend class or function to call
+        defaults: Keyword arguments passed unless overridden
+        passthrough: Also forward kwargs that are not in ``defaults``.
+            When False, unknown kwargs are dropped
+        converters: Callables applied to the named kwargs after merging,
+            e.g. to parse values that come from environment variables
+    """
+
+    __slots__ = ("_constructor", "_defaults", "_keys", "_converters")
+
+    def __init__(
+        self,
+        constructor: Callable[..., Any],
+        defaults: Optional[Mapping[str, Any]] = None,
+        passthrough: bool = False,
+        converters: Optional[Mapping[str, Callable[[Any], Any]]] = None,
+    ):
+        self._constructor = constructor
+        self._defaults = dict(defaults or {})
+        self._keys = None if passthrough else frozenset(self._defaults)
+        self._converters = tuple((converters or {}).items())
+
+    def __call__(self, **kwargs: Any) -> Any:
+        keys = self._keys
+        if keys is None:
+            merged = {**self._defaults, **kwargs}
+        else:
+            merged = dict(self._defaults)
+            for key, value in kwargs.items():
+                if key in keys:
+                    merged[key] = value
+        for key, convert in self._converters:
+            merged[key] = convert(merged.get(key))
+        return self._constructor(**merged)
+
+
 class ServiceFactory(Generic[T]):
     """
     Generic Service Factory base class that supports environment variables
@@ -24,6 +77,19 @@ class ServiceFactory(Generic[T]):
     _registry: Dict[str, Callable[..., T]] = {}
     _env_prefix: str = ""
     _default_backend: str = "in_memory"
+    _backend_env_key: Optional[str] = None
+
+    # Backend type as given -> interned lowercase form
+    _backend_type_cache: Dict[str, str] = {}
+
+    @classmethod
+    def _normalize_backend_type(cls, backend_type: str) -> str:
+        """Lowercase a backend type name, caching the result."""
+        normalized = cls._backend_type_cache.get(backend_type)
+        if normalized is None:
+            normalized = sys.intern(backend_type.lower())
+            cls._backend_type_cache[backend_type] = normalized
+        return normalized
 
     @classmethod
     def register_backend(
@@ -38,7 +104,7 @@ class ServiceFactory(Generic[T]):
             constructor: Constructor function used to create the service
                 instance
         """
-        cls._registry[backend_type.lower()] = constructor
+        cls._registry[cls._normalize_backend_type(backend_type)] = constructor
 
     @classmethod
     def _load_env_kwargs(cls, backend_type: str) -> Dict[str, Any]:
@@ -71,6 +137,9 @@ class ServiceFactory(Generic[T]):
         Create and start a service instance, supporting environment
         variables and kwargs.
 
+        Backend constructors that return an awaitable are awaited, use
+        :meth:`create_sync` when the backend is known to be synchronous.
+
         Args:
             backend_type: Backend type, if None will read from environment
                 variables
@@ -83,22 +152,55 @@ class ServiceFactory(Generic[T]):
         Raises:
             ValueError: If the backend_type is unsupported
         """
-        if backend_type is None:
-            backend_type = os.getenv(
-                f"{cls._env_prefix}BACKEND",
-                cls._default_backend,
-            )
-        backend_type = backend_type.lower()
+        service = cls.create_sync(backend_type, **kwargs)
+        if inspect.isawaitable(service):
+            service = await service
+        return service
+
+    @classmethod
+    def create_sync(
+        cls,
+        backend_type: Optional[str] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Create a service instance without going through the event loop,
+        supporting environment variables and kwargs.
+
+        Args:
+            backend_type: Backend type, if None will read from environment
+                variables
+            **kwargs: Additional parameters, having higher priority than
+                environment variables
+
+        Returns:
+            A service instance. If the backend constructor is
+                asynchronous, the awaitable it returned
 
-        constructor = cls._registry.get(backend_type)
+        Raises:
+            ValueError: If the backend_type is unsupported
+        """
+        if backend_type is None:
+            # Look up in the class's own __dict__, an inherited key would
+            # belong to another factory's prefix
+            env_key = cls.__dict__.get("_backend_env_key")
+            if env_key is None:
+                env_key = f"{cls._env_prefix}BACKEND"
+                cls._backend_env_key = env_key
+            backend_type = os.environ.get(env_key, cls._default_backend)
+        backend_type = cls._normalize_backend_type(backend_type)
+
+        registry = cls._registry
+        constructor = registry.get(backend_type)
         if constructor is None:
             raise ValueError(f"Unsupported backend type: {backend_type}")
 
         # 1. Load kwargs for this backend from environment variables
         env_kwargs = cls._load_env_kwargs(backend_type)
 
-        # 2. Merge priority: kwargs > environment variables
-        final_kwargs = {**env_kwargs, **kwargs}
+        # 2. Merge priority: kwargs > environment variables. Containers
+        # usually set nothing, so skip the merge copy in that case
+        final_kwargs = {**env_kwargs, **kwargs} if env_kwargs else kwargs
 
         # 3. Filter out kwargs that are not accepted by the constructor
         sig = inspect.signature(constructor)
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
+import atexit
 import json
 import logging
 import os
+import queue
 import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional, Set, Tuple
 
 from pydantic import BaseModel
 
@@ -58,7 +60,9 @@ class JsonFormatter(logging.Formatter):
             str: The formatted log record as a JSON string.
         """
         log_record = {
-            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+            "time": datetime.fromtimestamp(record.created).strftime(
+                "%Y-%m-%d %H:%M:%S.%f",
+            )[:-3],
             "step": getattr(record, "step", None),
             "model": getattr(record, "model", None),
             "user_id": getattr(record, "user_id", None),
@@ -82,9 +86,32 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(log_record, ensure_ascii=False)
 
 
+class ContextQueueHandler(QueueHandler):
+    """Queue handler that hands records to a background writer thread.
+
+    Context-dependent fields are resolved in the emitting context, since
+    context variables such as the request id are not visible from the
+    listener thread that formats and writes the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not hasattr(record, "request_id"):
+            record.request_id = TracingUtil.get_request_id()
+        # The record never leaves the process, keep it intact (including
+        # exc_info) for the JsonFormatter of the target handlers
+        return record
+
+
 class LocalLogHandler(TracerHandler):
     """llm chat log handler for structured JSON logging."""
 
+    # Handler configurations already attached to the shared logger. All
+    # instances log through the same module-wide logger, so each
+    # configuration is installed once per process instead of once per
+    # instance. The key holds every setting of the handlers, so an
+    # instance asking for e.g. another rotation size gets its own.
+    _installed_targets: Set[Tuple[Any, ...]] = set()
+
     def __init__(
         self,
         log_level: int = logging.INFO,
@@ -113,17 +140,28 @@ class LocalLogHandler(TracerHandler):
         # Store kwargs for potential future use
         self._extra_kwargs = kwargs
         self.logger = logging.getLogger(DEFAULT_LOG_NAME)
-        if enable_console:
+        installed = LocalLogHandler._installed_targets
+        if enable_console and ("console",) not in installed:
             handler = logging.StreamHandler()
             handler.setFormatter(JsonFormatter())
             self.logger.addHandler(handler)
-        os.makedirs(log_dir, exist_ok=True)
-        self._set_file_handle(
-            log_dir=log_dir,
-            log_file_name=log_file_name,
-            max_bytes=max_bytes,
-            backup_count=backup_count,
+            installed.add(("console",))
+        file_target = (
+            "file",
+            log_dir,
+            log_file_name,
+            max_bytes,
+            backup_count,
         )
+        if file_target not in installed:
+            os.makedirs(log_dir, exist_ok=True)
+            self._set_file_handle(
+                log_dir=log_dir,
+                log_file_name=log_file_name,
+                max_bytes=max_bytes,
+                backup_count=backup_count,
+            )
+            installed.add(file_target)
 
         self.logger.setLevel(log_level)
 
@@ -136,6 +174,8 @@ class LocalLogHandler(TracerHandler):
     ) -> None:
         """Set up file handlers for logging.
 
+        Files are opened lazily on the first emitted record.
+
         Args:
             log_dir (str): Directory to save the log files.
             log_file_name (Optional[str]): Prefix name of log file name.
@@ -155,6 +195,7 @@ class LocalLogHandler(TracerHandler):
             mode="a",
             maxBytes=max_bytes,
             backupCount=backup_count,
+            delay=True,
         )
         info_file_handler.setFormatter(JsonFormatter())
         info_file_handler.setLevel(logging.INFO)
@@ -170,13 +211,24 @@ class LocalLogHandler(TracerHandler):
             mode="a",
             maxBytes=max_bytes,
             backupCount=backup_count,
+            delay=True,
         )
         error_file_handler.setFormatter(JsonFormatter())
         error_file_handler.setLevel(logging.ERROR)
 
-        # Add handlers to the logger
-        self.logger.addHandler(info_file_handler)
-        self.logger.addHandler(error_file_handler)
+        # File writes (and rotation) happen on a background listener
+        # thread, logging calls only enqueue the record
+        queue_handler = ContextQueueHandler(queue.SimpleQueue())
+        listener = QueueListener(
+            queue_handler.queue,
+            info_file_handler,
+            error_file_handler,
+            respect_handler_level=True,
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+        self.logger.addHandler(queue_handler)
 
     @staticmethod
     def _deep_update(original: Dict[str, Any], update: Dict[str, Any]) -> None:
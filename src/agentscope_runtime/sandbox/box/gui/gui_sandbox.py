@@ -3,7 +3,7 @@
 import logging
 from typing import Optional, Union, Tuple, List
 
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urljoin, quote_plus
 
 from ...utils import build_image_uri, get_platform
 from ...registry import SandboxRegistry
@@ -13,6 +13,9 @@ from ...constant import TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+_VNC_LITE_PATH = "/vnc/vnc_lite.html"
+_VNC_RELAY_PATH = "/vnc/vnc_relay.html"
+
 
 class GUIMixin:
     @property
@@ -21,16 +24,15 @@ class GUIMixin:
             raise RuntimeError(f"Sandbox {self.sandbox_id} is not healthy")
 
         info = self.get_info()
-        path = "/vnc/vnc_lite.html"
-        remote_path = "/vnc/vnc_relay.html"
-        params = {"password": info["runtime_token"]}
+        # Same encoding as urlencode() for the single password parameter
+        query = "?password=" + quote_plus(info["runtime_token"])
 
         if self.base_url is None:
-            return urljoin(info["url"], path) + "?" + urlencode(params)
+            return urljoin(info["url"], _VNC_LITE_PATH) + query
 
         return (
-            f"{self.base_url}/desktop/{self.sandbox_id}{remote_path}"
-            f"?{urlencode(params)}"
+            f"{self.base_url}/desktop/{self.sandbox_id}{_VNC_RELAY_PATH}"
+            f"{query}"
         )
 
 
@@ -134,8 +134,8 @@ class SandboxHttpClient:
         """
         Waits until the runtime service is running for a specified timeout.
         """
-        start_time = time.time()
-        while time.time() - start_time < self.start_timeout:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < self.start_timeout:
             if self.check_health():
                 return
             time.sleep(1)
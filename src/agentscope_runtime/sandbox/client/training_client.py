@@ -32,8 +32,8 @@ class TrainingSandboxClient:
         """
         Waits until the runtime service is running for a specified timeout.
         """
-        start_time = time.time()
-        while time.time() - start_time < self.timeout:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < self.timeout:
             if self.check_health():
                 return
             time.sleep(1)
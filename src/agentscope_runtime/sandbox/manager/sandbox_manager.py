@@ -441,7 +441,7 @@ class SandboxManager:
             logger.warning(
                 "Error getting container from pool, create a new one.",
             )
-            logger.debug(f"{e}: {traceback.format_exc()}")
+            logger.debug(f"{e}", exc_info=True)
             return self.create()
 
     @remote_wrapper()
@@ -569,7 +569,7 @@ class SandboxManager:
 
             # Check the container status
             status = self.client.get_status(container_name)
-            if self.client.get_status(container_name) != "running":
+            if status != "running":
                 logger.warning(
                     f"Container {container_name} is not running. Current "
                     f"status: {status}",
@@ -617,7 +617,7 @@ class SandboxManager:
             logger.warning(
                 f"Failed to create container: {e}",
             )
-            logger.debug(f"{traceback.format_exc()}")
+            logger.debug("Traceback:", exc_info=True)
             self.release(identity=container_name)
             return None
 
@@ -668,7 +668,7 @@ class SandboxManager:
             logger.warning(
                 f"Failed to destroy container: {e}",
             )
-            logger.debug(f"{traceback.format_exc()}")
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @remote_wrapper()
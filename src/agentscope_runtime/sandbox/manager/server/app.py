@@ -7,6 +7,7 @@ import logging
 from typing import Optional
 
 import httpx
+import orjson
 import websockets
 
 from fastapi import FastAPI, HTTPException, Request, Depends
@@ -158,7 +159,7 @@ def create_endpoint(method):
         token: HTTPAuthorizationCredentials = Depends(verify_token),
     ):
         try:
-            data = await request.json()
+            data = orjson.loads(await request.body())
             logger.info(
                 f"Calling {method.__name__} with data: {data}",
             )
@@ -234,7 +235,11 @@ async def health_check():
 
 @app.get("/desktop/{sandbox_id}/{path:path}")
 async def proxy_vnc_static(sandbox_id: str, path: str):
-    container_json = _sandbox_manager.container_mapping.get(sandbox_id)
+    # The mapping may be backed by a blocking Redis client
+    container_json = await asyncio.to_thread(
+        _sandbox_manager.container_mapping.get,
+        sandbox_id,
+    )
     if not container_json:
         return Response(status_code=404)
 
@@ -268,7 +273,8 @@ async def websocket_endpoint(
 
     await websocket.accept()
 
-    container_json = _sandbox_manager.container_mapping.get(
+    container_json = await asyncio.to_thread(
+        _sandbox_manager.container_mapping.get,
         sandbox_id,
     )
     service_address = None
@@ -1,4 +1,95 @@
 # -*- coding: utf-8 -*-
-from .base import *
-from .payment import *
-from .subscribe import *
+from typing import TYPE_CHECKING
+from ...common.utils.lazy_loader import install_lazy_loader
+
+# The payment and subscribe tools each pull in their own part of the Alipay
+# SDK, so only import a module once one of its members is used
+if TYPE_CHECKING:
+    from .base import (
+        ALIPAY_SDK_AVAILABLE,
+        AP_CURRENT_ENV,
+        ALIPAY_APP_ID,
+        ALIPAY_PRIVATE_KEY,
+        ALIPAY_PUBLIC_KEY,
+        AP_RETURN_URL,
+        AP_NOTIFY_URL,
+        X_AGENT_CHANNEL,
+        ensure_pkcs1_format,
+        AgentExtendParams,
+        AgentAlipayClient,
+        get_alipay_gateway_url,
+    )
+    from .payment import (
+        MobilePaymentInput,
+        WebPagePaymentInput,
+        PaymentQueryInput,
+        PaymentRefundInput,
+        RefundQueryInput,
+        PaymentOutput,
+        MobileAlipayPayment,
+        WebPageAlipayPayment,
+        AlipayPaymentQuery,
+        AlipayPaymentRefund,
+        AlipayRefundQuery,
+    )
+    from .subscribe import (
+        SUBSCRIBE_PLAN_ID,
+        X_AGENT_NAME,
+        USE_TIMES,
+        SubscribeStatusCheckInput,
+        SubscribeStatusOutput,
+        SubscribePackageInitializeInput,
+        SubscribePackageInitializeOutput,
+        SubscribeTimesSaveInput,
+        SubscribeTimesSaveOutput,
+        SubscribeCheckOrInitializeInput,
+        SubscribeCheckOrInitializeOutput,
+        AlipaySubscribeStatusCheck,
+        AlipaySubscribePackageInitialize,
+        AlipaySubscribeTimesSave,
+        AlipaySubscribeCheckOrInitialize,
+    )
+
+install_lazy_loader(
+    globals(),
+    {
+        "ALIPAY_SDK_AVAILABLE": ".base",
+        "AP_CURRENT_ENV": ".base",
+        "ALIPAY_APP_ID": ".base",
+        "ALIPAY_PRIVATE_KEY": ".base",
+        "ALIPAY_PUBLIC_KEY": ".base",
+        "AP_RETURN_URL": ".base",
+        "AP_NOTIFY_URL": ".base",
+        "X_AGENT_CHANNEL": ".base",
+        "ensure_pkcs1_format": ".base",
+        "AgentExtendParams": ".base",
+        "AgentAlipayClient": ".base",
+        "get_alipay_gateway_url": ".base",
+        "MobilePaymentInput": ".payment",
+        "WebPagePaymentInput": ".payment",
+        "PaymentQueryInput": ".payment",
+        "PaymentRefundInput": ".payment",
+        "RefundQueryInput": ".payment",
+        "PaymentOutput": ".payment",
+        "MobileAlipayPayment": ".payment",
+        "WebPageAlipayPayment": ".payment",
+        "AlipayPaymentQuery": ".payment",
+        "AlipayPaymentRefund": ".payment",
+        "AlipayRefundQuery": ".payment",
+        "SUBSCRIBE_PLAN_ID": ".subscribe",
+        "X_AGENT_NAME": ".subscribe",
+        "USE_TIMES": ".subscribe",
+        "SubscribeStatusCheckInput": ".subscribe",
+        "SubscribeStatusOutput": ".subscribe",
+        "SubscribePackageInitializeInput": ".subscribe",
+        "SubscribePackageInitializeOutput": ".subscribe",
+        "SubscribeTimesSaveInput": ".subscribe",
+        "SubscribeTimesSaveOutput": ".subscribe",
+        "SubscribeCheckOrInitializeInput": ".subscribe",
+        "SubscribeCheckOrInitializeOutput": ".subscribe",
+        "AlipaySubscribeStatusCheck": ".subscribe",
+        "AlipaySubscribePackageInitialize": ".subscribe",
+        "AlipaySubscribeTimesSave": ".subscribe",
+        "AlipaySubscribeCheckOrInitialize": ".subscribe",
+    },
+)
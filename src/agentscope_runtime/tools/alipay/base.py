@@ -17,6 +17,7 @@ foundational functionality provided by this module.
 """
 
 
+import functools
 import os
 import logging
 from typing import Optional, Any, Type, Dict
@@ -34,6 +35,9 @@ try:
     from alipay.aop.api.domain.ExtendParams import (
         ExtendParams,
     )
+    from alipay.aop.api.constant.ParamConstants import (
+        COMMON_PARAM_KEYS,
+    )
 
     ALIPAY_SDK_AVAILABLE = True
 except ImportError:
@@ -41,6 +45,13 @@ except ImportError:
     DefaultAlipayClient: Optional[Type[Any]] = None
     AlipayClientConfig: Optional[Type[Any]] = None
     ExtendParams: Optional[Type[Any]] = None
+    COMMON_PARAM_KEYS = set()
+
+# Common parameters stripped from the request parameters, keeping our
+# custom AI agent identifier
+_COMMON_PARAM_KEYS_TO_REMOVE = frozenset(COMMON_PARAM_KEYS) - {
+    "x_agent_source",
+}
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +62,15 @@ load_dotenv()
 # sandbox environment
 AP_CURRENT_ENV = os.getenv("AP_CURRENT_ENV", "production")
 
+# Alipay gateway URL for the configured environment
+ALIPAY_GATEWAY_URL = (
+    "https://openapi-sandbox.dl.alipaydev.com/gateway.do"
+    if AP_CURRENT_ENV == "sandbox"
+    else "https://openapi.alipay.com/gateway.do"
+)
+# Signature algorithm type
+ALIPAY_SIGN_TYPE = "RSA2"
+
 # Application ID (APPID) applied by the merchant on the Alipay open platform.
 ALIPAY_APP_ID = os.getenv("ALIPAY_APP_ID", "")
 # Merchant's private key applied via Alipay open platform.
@@ -110,8 +130,9 @@ class AgentExtendParams(
         else:
             params = {}
 
-        if self.request_channel_source:
-            params["request_channel_source"] = self.request_channel_source
+        request_channel_source = self._request_channel_source
+        if request_channel_source:
+            params["request_channel_source"] = request_channel_source
         return params
 
     @staticmethod
@@ -162,11 +183,7 @@ def get_alipay_gateway_url() -> str:
             - 沙箱环境: https://openapi-sandbox.dl.alipaydev.com/gateway.do
             - 生产环境: https://openapi.alipay.com/gateway.do
     """
-    return (
-        "https://openapi-sandbox.dl.alipaydev.com/gateway.do"
-        if AP_CURRENT_ENV == "sandbox"
-        else "https://openapi.alipay.com/gateway.do"
-    )
+    return ALIPAY_GATEWAY_URL
 
 
 def _check_config_and_sdk() -> None:
@@ -264,24 +281,21 @@ class AgentAlipayClient(DefaultAlipayClient):
         if not params:
             return params
 
-        # Import the COMMON_PARAM_KEYS constant from parent
-        from alipay.aop.api.constant.ParamConstants import COMMON_PARAM_KEYS
-
-        # Create a new constant set excluding our custom parameters
-        keys_to_remove = COMMON_PARAM_KEYS.copy()
-        keys_to_remove.discard("x_agent_source")
-
-        for k in keys_to_remove:
-            if k in params:
-                params.pop(k)
+        for k in _COMMON_PARAM_KEYS_TO_REMOVE:
+            params.pop(k, None)
 
         return params
 
 
+@functools.lru_cache(maxsize=1)
 def _create_alipay_client() -> Any:
     """
     Create an Alipay client instance.
 
+    The configuration is read from environment variables at import time, so
+    the client is built once per process and shared by all callers. A failed
+    creation is not cached.
+
     This function performs:
     1. Validates configuration and SDK availability
     2. Loads key configuration from environment variables
@@ -298,6 +312,9 @@ def _create_alipay_client() -> Any:
     ---
     创建支付宝客户端实例
 
+    配置在导入时从环境变量读取，因此每个进程只创建一次客户端并由所有调用方共享。
+    创建失败时不会被缓存。
+
     该函数会执行以下操作：
     1. 验证配置和SDK可用性
     2. 读取环境变量中的密钥配置
@@ -323,12 +340,11 @@ def _create_alipay_client() -> Any:
 
     # Create Alipay client configuration object
     alipay_client_config = AlipayClientConfig()
-    gateway_url = get_alipay_gateway_url()
-    alipay_client_config.server_url = gateway_url
+    alipay_client_config.server_url = ALIPAY_GATEWAY_URL
     alipay_client_config.app_id = ALIPAY_APP_ID  # App ID
     alipay_client_config.app_private_key = private_key  # App private key
     alipay_client_config.alipay_public_key = public_key  # Alipay public key
-    alipay_client_config.sign_type = "RSA2"  # Signature algorithm type
+    alipay_client_config.sign_type = ALIPAY_SIGN_TYPE
 
     # Create and return Alipay client instance
     return AgentAlipayClient(alipay_client_config=alipay_client_config)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # mypy: disable-error-code="no-redef"
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Optional, Type
@@ -516,7 +517,10 @@ class AlipayPaymentQuery(Tool[PaymentQueryInput, PaymentOutput]):
             request = AlipayTradeQueryRequest(biz_model=model)
 
             # Execute query request
-            response_content = alipay_client.execute(request)
+            response_content = await asyncio.to_thread(
+                alipay_client.execute,
+                request,
+            )
             response = AlipayTradeQueryResponse()
             response.parse_response_content(response_content)
 
@@ -665,7 +669,10 @@ class AlipayPaymentRefund(Tool[PaymentRefundInput, PaymentOutput]):
             request = AlipayTradeRefundRequest(biz_model=model)
 
             # Execute refund request
-            response_content = alipay_client.execute(request)
+            response_content = await asyncio.to_thread(
+                alipay_client.execute,
+                request,
+            )
             response = AlipayTradeRefundResponse()
             response.parse_response_content(response_content)
 
@@ -797,7 +804,10 @@ class AlipayRefundQuery(Tool[RefundQueryInput, PaymentOutput]):
             request = AlipayTradeFastpayRefundQueryRequest(biz_model=model)
 
             # Execute refund query
-            response_content = alipay_client.execute(request)
+            response_content = await asyncio.to_thread(
+                alipay_client.execute,
+                request,
+            )
             response = AlipayTradeFastpayRefundQueryResponse()
             response.parse_response_content(response_content)
 
@@ -2,9 +2,12 @@
 # pylint:disable=protected-access, line-too-long
 # mypy: disable-error-code="no-redef"
 
+import asyncio
+import http.client
 import logging
 import os
-from typing import Any, Optional, Type
+import time
+from typing import Any, Dict, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field
 
@@ -34,10 +37,13 @@ try:
     from alipay.aop.api.response.AlipayAipaySubscribeTimesSaveResponse import (
         AlipayAipaySubscribeTimesSaveResponse,
     )
+    from alipay.aop.api.exception.Exception import AopException
 
     ALIPAY_SDK_AVAILABLE = True
+    _SDK_ERRORS: Tuple[Type[BaseException], ...] = (AopException,)
 except ImportError:
     ALIPAY_SDK_AVAILABLE = False
+    _SDK_ERRORS = ()
     AlipayAipaySubscribeStatusCheckRequest: Optional[Type[Any]] = None
     AlipayAipaySubscribePackageInitializeRequest: Optional[Type[Any]] = None
     AlipayAipaySubscribeTimesSaveRequest: Optional[Type[Any]] = None
@@ -48,6 +54,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Failures reported as a negative result rather than raised: Alipay SDK
+# errors, network errors around the gateway call, and configuration or
+# response decoding errors
+_SUBSCRIBE_ERRORS = (
+    *_SDK_ERRORS,
+    OSError,
+    http.client.HTTPException,
+    ValueError,
+)
+
 # Subscription plan ID - Set by developer in Alipay subscription management
 SUBSCRIBE_PLAN_ID = os.getenv("SUBSCRIBE_PLAN_ID", "")
 # AI agent name - Used to identify the AI agent
@@ -55,6 +71,33 @@ X_AGENT_NAME = os.getenv("X_AGENT_NAME", "")
 # Subscription usage count - Number of uses deducted after service, default
 # is 1 if not set
 USE_TIMES = int(os.getenv("USE_TIMES", "1"))
+# Whether the check-or-initialize component requests the subscription link
+# in parallel with the status check, trading an extra initialize call for
+# subscribed users against one round trip less for unsubscribed ones
+SUBSCRIBE_PARALLEL_INIT = (
+    os.getenv("SUBSCRIBE_PARALLEL_INIT", "false").lower() == "true"
+)
+# Seconds a successful subscription status check is reused for the same
+# uuid, 0 (the default) always asks Alipay
+AP_STATUS_TTL = float(os.getenv("AP_STATUS_TTL", "0"))
+_STATUS_CACHE_MAXSIZE = 10000
+
+# Request fields that do not change between calls, merged into each
+# request's biz_content
+_STATUS_CHECK_BIZ_CONTENT = {
+    "plan_id": SUBSCRIBE_PLAN_ID,
+    "channel": X_AGENT_CHANNEL,
+}
+_PACKAGE_INIT_BIZ_CONTENT = {
+    "plan_id": SUBSCRIBE_PLAN_ID,
+    "channel": X_AGENT_CHANNEL,
+    "agent_name": X_AGENT_NAME,
+}
+_TIMES_SAVE_BIZ_CONTENT = {
+    "plan_id": SUBSCRIBE_PLAN_ID,
+    "use_times": USE_TIMES,
+    "channel": X_AGENT_CHANNEL,
+}
 
 
 class SubscribeStatusCheckInput(BaseModel):
@@ -141,6 +184,30 @@ class SubscribeCheckOrInitializeOutput(BaseModel):
     )
 
 
+# uuid -> (expiry time, status check output)
+_status_cache: Dict[str, Tuple[float, SubscribeStatusOutput]] = {}
+
+
+def _get_cached_status(uuid: str) -> Optional[SubscribeStatusOutput]:
+    entry = _status_cache.get(uuid)
+    if entry is None:
+        return None
+    expires_at, output = entry
+    if expires_at < time.monotonic():
+        _status_cache.pop(uuid, None)
+        return None
+    return output.model_copy()
+
+
+def _cache_status(uuid: str, output: SubscribeStatusOutput) -> None:
+    if AP_STATUS_TTL <= 0:
+        return
+    if len(_status_cache) >= _STATUS_CACHE_MAXSIZE:
+        # Drop the oldest entry
+        _status_cache.pop(next(iter(_status_cache)), None)
+    _status_cache[uuid] = (time.monotonic() + AP_STATUS_TTL, output)
+
+
 class AlipaySubscribeStatusCheck(
     Tool[SubscribeStatusCheckInput, SubscribeStatusOutput],
 ):
@@ -195,18 +262,23 @@ class AlipaySubscribeStatusCheck(
                     "Subscription configuration error: Please set the "
                     "SUBSCRIBE_PLAN_ID environment variable",
                 )
+            cached = _get_cached_status(args.uuid)
+            if cached is not None:
+                return cached
+
             # Create Alipay client instance
             alipay_client = _create_alipay_client()
 
             # Create subscription status check request
             request = AlipayAipaySubscribeStatusCheckRequest()
-            biz_content = {
-                "uuid": args.uuid,
-                "plan_id": SUBSCRIBE_PLAN_ID,
-                "channel": X_AGENT_CHANNEL,
-            }
+            biz_content = {"uuid": args.uuid, **_STATUS_CHECK_BIZ_CONTENT}
             request.biz_content = biz_content
-            response_content = alipay_client.execute(request)
+            # The SDK call is a blocking HTTP request, keep it off the
+            # event loop
+            response_content = await asyncio.to_thread(
+                alipay_client.execute,
+                request,
+            )
             response = AlipayAipaySubscribeStatusCheckResponse()
             response.parse_response_content(response_content)
             if response.is_success:
@@ -233,10 +305,12 @@ class AlipaySubscribeStatusCheck(
                         # date
                         expired_date = info.expired_date
                         subscribe_package_desc = f"{expired_date}后过期"
-                return SubscribeStatusOutput(
+                output = SubscribeStatusOutput(
                     subscribe_flag=is_subscribed,
                     subscribe_package=subscribe_package_desc,
                 )
+                _cache_status(args.uuid, output)
+                return output
             else:
                 error_msg = (
                     f"Subscription check API returned an error: "
@@ -258,7 +332,7 @@ class AlipaySubscribeStatusCheck(
                 subscribe_flag=False,
                 subscribe_package=None,
             )
-        except Exception as e:
+        except _SUBSCRIBE_ERRORS as e:
             logger.error(f"Failed to check subscription status: {str(e)}")
             return SubscribeStatusOutput(
                 subscribe_flag=False,
@@ -325,14 +399,14 @@ class AlipaySubscribePackageInitialize(
 
             # Create subscription initialize request
             request = AlipayAipaySubscribePackageInitializeRequest()
-            biz_content = {
-                "uuid": args.uuid,
-                "plan_id": SUBSCRIBE_PLAN_ID,
-                "channel": X_AGENT_CHANNEL,
-                "agent_name": X_AGENT_NAME,
-            }
+            biz_content = {"uuid": args.uuid, **_PACKAGE_INIT_BIZ_CONTENT}
             request.biz_content = biz_content
-            response_content = alipay_client.execute(request)
+            # The SDK call is a blocking HTTP request, keep it off the
+            # event loop
+            response_content = await asyncio.to_thread(
+                alipay_client.execute,
+                request,
+            )
             response = AlipayAipaySubscribePackageInitializeResponse()
             response.parse_response_content(response_content)
             if response.is_success:
@@ -353,7 +427,7 @@ class AlipaySubscribePackageInitialize(
                 "Alipay SDK not installed: pip install alipay-sdk-python",
             )
             return SubscribePackageInitializeOutput(subscribe_url=None)
-        except Exception as e:
+        except _SUBSCRIBE_ERRORS as e:
             logger.error(f"Subscription init failed: {str(e)}")
             return SubscribePackageInitializeOutput(subscribe_url=None)
 
@@ -418,16 +492,21 @@ class AlipaySubscribeTimesSave(
             request = AlipayAipaySubscribeTimesSaveRequest()
             biz_content = {
                 "uuid": args.uuid,
-                "plan_id": SUBSCRIBE_PLAN_ID,
-                "use_times": USE_TIMES,
-                "channel": X_AGENT_CHANNEL,
+                **_TIMES_SAVE_BIZ_CONTENT,
                 "out_request_no": args.out_request_no,
             }
             request.biz_content = biz_content
-            response_content = alipay_client.execute(request)
+            # The SDK call is a blocking HTTP request, keep it off the
+            # event loop
+            response_content = await asyncio.to_thread(
+                alipay_client.execute,
+                request,
+            )
             response = AlipayAipaySubscribeTimesSaveResponse()
             response.parse_response_content(response_content)
             if response.is_success:
+                # The remaining times changed, do not serve the old status
+                _status_cache.pop(args.uuid, None)
                 return SubscribeTimesSaveOutput(
                     success=response.data.count_success,
                 )
@@ -445,7 +524,7 @@ class AlipaySubscribeTimesSave(
                 "Alipay SDK not installed: pip install alipay-sdk-python",
             )
             return SubscribeTimesSaveOutput(success=False)
-        except Exception as e:
+        except _SUBSCRIBE_ERRORS as e:
             logger.error(f"Subscription times save failed: {str(e)}")
             return SubscribeTimesSaveOutput(success=False)
 
@@ -492,6 +571,15 @@ class AlipaySubscribeCheckOrInitialize(
     name: str = "alipay_subscribe_check_or_initialize"
     description: str = "检查用户订阅状态，如果已订阅则返回状态，如果未订阅则返回订阅链接"
 
+    @staticmethod
+    async def _initialize(
+        args: SubscribeCheckOrInitializeInput,
+    ) -> SubscribePackageInitializeOutput:
+        """Request the subscription link for the user."""
+        init_component = AlipaySubscribePackageInitialize()
+        init_input = SubscribePackageInitializeInput(uuid=args.uuid)
+        return await init_component._arun(init_input)
+
     async def _arun(
         self,
         args: SubscribeCheckOrInitializeInput,
@@ -504,14 +592,22 @@ class AlipaySubscribeCheckOrInitialize(
                     "Subscription config error: set SUBSCRIBE_PLAN_ID and "
                     "X_AGENT_NAME env variables.",
                 )
-            # First, check subscription status
             status_check = AlipaySubscribeStatusCheck()
-            status_input = SubscribeStatusCheckInput(
-                uuid=args.uuid,
-                plan_id=SUBSCRIBE_PLAN_ID,
-                channel=X_AGENT_CHANNEL,
-            )
-            status_output = await status_check._arun(status_input)
+            # plan_id, channel and agent_name come from module settings,
+            # the input models only carry the uuid
+            status_input = SubscribeStatusCheckInput(uuid=args.uuid)
+
+            if SUBSCRIBE_PARALLEL_INIT:
+                # Request the subscription link up front and discard it if
+                # the user turns out to be subscribed
+                status_output, init_result = await asyncio.gather(
+                    status_check._arun(status_input),
+                    self._initialize(args),
+                )
+            else:
+                # First, check subscription status
+                status_output = await status_check._arun(status_input)
+                init_result = None
 
             # If subscribed, return status
             if status_output.subscribe_flag:
@@ -521,14 +617,8 @@ class AlipaySubscribeCheckOrInitialize(
                 )
 
             # If not subscribed, initialize
-            init_component = AlipaySubscribePackageInitialize()
-            init_input = SubscribePackageInitializeInput(
-                uuid=args.uuid,
-                plan_id=SUBSCRIBE_PLAN_ID,
-                channel=X_AGENT_CHANNEL,
-                agent_name=X_AGENT_NAME,
-            )
-            init_result = await init_component._arun(init_input)
+            if init_result is None:
+                init_result = await self._initialize(args)
 
             return SubscribeCheckOrInitializeOutput(
                 subscribe_flag=False,
@@ -543,7 +633,7 @@ class AlipaySubscribeCheckOrInitialize(
                 subscribe_flag=False,
                 subscribe_url=None,
             )
-        except Exception as e:
+        except _SUBSCRIBE_ERRORS as e:
             logger.error(f"Subscription check or init failed: {str(e)}")
             return SubscribeCheckOrInitializeOutput(
                 subscribe_flag=False,
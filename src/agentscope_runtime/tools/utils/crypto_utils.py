@@ -2,19 +2,107 @@
 """
 Crypto utilities for key format conversion.
 """
+import binascii
+import os
+from typing import Any, Callable, Optional, Union
 
 try:
+    import cryptography
     from cryptography.hazmat.primitives import serialization
     from cryptography.hazmat.backends import default_backend
 
     CRYPTOGRAPHY_AVAILABLE = True
 except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
+    cryptography = None
     serialization = None
     default_backend = None
 
+if CRYPTOGRAPHY_AVAILABLE:
+    _BACKEND = default_backend()
+    _PEM = serialization.Encoding.PEM
+    _PKCS1_FORMAT = serialization.PrivateFormat.TraditionalOpenSSL
+    _NO_ENCRYPTION = serialization.NoEncryption()
+else:
+    _BACKEND = _PEM = _PKCS1_FORMAT = _NO_ENCRYPTION = None
 
-def ensure_pkcs1_format(private_key_string: str) -> str:
+# Deletes the whitespace that may be found in base64 key bodies
+_WHITESPACE_TABLE = str.maketrans("", "", " \t\r\n\v\f")
+
+# The loaded key is only re-encoded, never used to sign, so the expensive
+# RSA consistency checks on load can be skipped. Opt-in, as a broken key
+# then only fails once it is used. The loaders take
+# unsafe_skip_rsa_key_validation since cryptography 39.
+_FAST_RSA_LOAD = (
+    CRYPTOGRAPHY_AVAILABLE
+    and int(cryptography.__version__.split(".", 1)[0]) >= 39
+    and os.getenv("AGENTSCOPE_RUNTIME_FAST_RSA_LOAD", "")
+    in ("1", "true", "True")
+)
+
+
+def _load_private_key(
+    loader: Callable[..., Any],
+    data: bytes,
+    password: Optional[bytes],
+) -> Any:
+    """Load a key with ``serialization.load_pem_private_key`` or
+    ``serialization.load_der_private_key``."""
+    if _FAST_RSA_LOAD:
+        return loader(
+            data=data,
+            password=password,
+            unsafe_skip_rsa_key_validation=True,
+        )
+    return loader(
+        data=data,
+        password=password,
+        backend=_BACKEND,
+    )
+
+
+def _is_der(key: Union[str, bytes]) -> bool:
+    """Tell raw DER bytes from PEM or Base64 text.
+
+    PEM and Base64 are plain ASCII, while the DER encoding of any RSA key
+    starts with a long-form length byte above 0x7F.
+    """
+    return isinstance(key, bytes) and not key.isascii()
+
+
+def _der_to_pkcs1(der: bytes) -> bytes:
+    """Convert a PKCS#1 or PKCS#8 DER private key to PKCS#1 PEM."""
+    try:
+        private_key = _load_private_key(
+            serialization.load_der_private_key,
+            data=der,
+            password=None,
+        )
+        return private_key.private_bytes(
+            encoding=_PEM,
+            format=_PKCS1_FORMAT,
+            encryption_algorithm=_NO_ENCRYPTION,
+        )
+    except Exception as e:
+        raise ValueError(
+            f"Failed to parse or convert the provided private key. Please "
+            f"check if it is valid: {e}",
+        ) from e
+
+
+def _check_private_key_input(private_key_string: Union[str, bytes]) -> None:
+    # Check if cryptography library is available
+    if not CRYPTOGRAPHY_AVAILABLE:
+        raise ImportError(
+            "Please install the cryptography library: pip "
+            "install cryptography",
+        )
+
+    if not private_key_string or not private_key_string.strip():
+        raise ValueError("The private key string cannot be empty.")
+
+
+def ensure_pkcs1_format(private_key_string: Union[str, bytes]) -> str:
     """
     Receive a private key string of unknown format and ensure the output is
     in PKCS#1 format.
@@ -22,10 +110,12 @@ def ensure_pkcs1_format(private_key_string: str) -> str:
     Supported input formats:
     - PKCS#1 PEM format
     - PKCS#8 PEM format
+    - PKCS#1 or PKCS#8 pure Base64
+    - PKCS#1 or PKCS#8 raw DER bytes
 
     Args:
-        private_key_string: A string containing the private key (PEM format
-        or pure Base64)
+        private_key_string: A string or bytes containing the private
+        key (PEM format, pure Base64 or DER)
 
     Returns:
         A string containing the private key in PKCS#1 PEM format.
@@ -34,61 +124,52 @@ def ensure_pkcs1_format(private_key_string: str) -> str:
         ImportError: Raised when the cryptography library is not installed.
         ValueError: Raised when the private key string is invalid or empty.
     """
-    # Check if cryptography library is available
-    if not CRYPTOGRAPHY_AVAILABLE:
-        raise ImportError(
-            "Please install the cryptography library: pip "
-            "install cryptography",
-        )
+    _check_private_key_input(private_key_string)
 
-    if not private_key_string or not private_key_string.strip():
-        raise ValueError("The private key string cannot be empty.")
+    if _is_der(private_key_string):
+        # Raw DER, there is no text layer to decode
+        return _der_to_pkcs1(private_key_string).decode("ascii")
+
+    # Keep both forms, the str one for the format checks and the bytes one
+    # for the PEM loader
+    if isinstance(private_key_string, bytes):
+        key_bytes = private_key_string.strip()
+        key_string = key_bytes.decode("ascii")
+    else:
+        key_string = private_key_string.strip()
+        key_bytes = key_string.encode("utf-8")
+    return _convert_to_pkcs1(key_string, key_bytes).decode("ascii")
 
-    key_string = private_key_string.strip()
 
+def _convert_to_pkcs1(key_string: str, key_bytes: bytes) -> bytes:
+    """Parse a stripped private key string and re-encode it as PKCS#1."""
     try:
         # Try to load directly as PEM format
         if "-----BEGIN" in key_string:
-            private_key = serialization.load_pem_private_key(
-                data=key_string.encode("utf-8"),
+            private_key = _load_private_key(
+                serialization.load_pem_private_key,
+                data=key_bytes,
                 password=None,
-                backend=default_backend(),
             )
         else:
-            # If it's pure Base64, first try PKCS#8 format
-            clean_base64 = "".join(key_string.split())
-
-            try:
-                # Attempt PKCS#8 format PEM wrapping
-                pkcs8_pem = (
-                    f"-----BEGIN {'PRIVATE'} {'KEY'}-----\n"
-                    f"{clean_base64}\n-----END {'PRIVATE'} {'KEY'}-----"
-                )
-                private_key = serialization.load_pem_private_key(
-                    data=pkcs8_pem.encode("utf-8"),
-                    password=None,
-                    backend=default_backend(),
-                )
-            except Exception:
-                # If PKCS#8 fails, try PKCS#1 format PEM wrapping
-                pkcs1_pem = (
-                    f"-----BEGIN RSA {'PRIVATE'} {'KEY'}-----\n"
-                    f"{clean_base64}\n-----END RSA {'PRIVATE'} {'KEY'}-----"
-                )
-                private_key = serialization.load_pem_private_key(
-                    data=pkcs1_pem.encode("utf-8"),
-                    password=None,
-                    backend=default_backend(),
-                )
+            # Pure Base64, decode it ourselves. The DER loader detects
+            # PKCS#8 and PKCS#1 from the ASN.1 structure, so there is no
+            # need to try PEM wrappers for each format in turn
+            der = binascii.a2b_base64(key_string.translate(_WHITESPACE_TABLE))
+            private_key = _load_private_key(
+                serialization.load_der_private_key,
+                data=der,
+                password=None,
+            )
 
         # Force output in PKCS#1 format (Traditional OpenSSL format)
         pkcs1_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.TraditionalOpenSSL,
-            encryption_algorithm=serialization.NoEncryption(),
+            encoding=_PEM,
+            format=_PKCS1_FORMAT,
+            encryption_algorithm=_NO_ENCRYPTION,
         )
 
-        return pkcs1_pem.decode("utf-8")
+        return pkcs1_pem
 
     except Exception as e:
         # If loading or conversion fails (e.g., the key is corrupted),
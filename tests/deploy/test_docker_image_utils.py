@@ -3,9 +3,7 @@
 # pylint:disable=pointless-string-statement, protected-access
 
 import os
-import shutil
 import sys
-import tempfile
 
 # Mock classes will be provided by pytest-mock plugin
 
@@ -32,6 +30,13 @@ sys.path.insert(
 )
 
 
+@pytest.fixture(scope="session")
+def build_context_dir(tmp_path_factory):
+    """Build context shared by the tests whose build is mocked and never
+    writes into it."""
+    return str(tmp_path_factory.mktemp("build_context"))
+
+
 class TestRegistryConfig:
     """Test cases for RegistryConfig model."""
 
@@ -118,14 +123,6 @@ class TestDockerfileConfig:
 class TestDockerfileGenerator:
     """Test cases for DockerfileGenerator class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_generate_dockerfile_basic(self):
         """Test basic Dockerfile generation."""
         config = DockerfileConfig()
@@ -156,13 +153,13 @@ class TestDockerfileGenerator:
 
         assert 'CMD ["python app.py"]' in dockerfile_content
 
-    def test_create_dockerfile(self):
+    def test_create_dockerfile(self, tmp_path):
         """Test writing Dockerfile to file."""
         config = DockerfileConfig()
         generator = DockerfileGenerator()
 
-        dockerfile_path = os.path.join(self.temp_dir, "Dockerfile")
-        result_path = generator.create_dockerfile(config, self.temp_dir)
+        dockerfile_path = os.path.join(tmp_path, "Dockerfile")
+        result_path = generator.create_dockerfile(config, str(tmp_path))
 
         assert result_path == dockerfile_path
         assert os.path.exists(dockerfile_path)
@@ -175,15 +172,7 @@ class TestDockerfileGenerator:
 class TestDockerImageBuilder:
     """Test cases for DockerImageBuilder class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
-    def test_build_image_mock(self, mocker):
+    def test_build_image_mock(self, mocker, build_context_dir):
         mock_subprocess = mocker.patch("subprocess.run")
         """Test build_image method with mocks."""
         # Mock subprocess.run for both docker --version and docker build
@@ -200,7 +189,7 @@ class TestDockerImageBuilder:
         builder = DockerImageBuilder()
 
         result = builder.build_image(
-            build_context=self.temp_dir,
+            build_context=build_context_dir,
             image_name="test-image",
             image_tag="latest",
             config=build_config,
@@ -214,24 +203,16 @@ class TestDockerImageBuilder:
 class TestImageFactory:
     """Test cases for RunnerImageFactory class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_image_factory_creation(self):
         """Test RunnerImageFactory creation."""
         factory = ImageFactory()
         assert isinstance(factory, ImageFactory)
 
-    def test_build_image_mock(self, mocker):
+    def test_build_image_mock(self, mocker, tmp_path):
         mock_bundle = mocker.patch(
             "agentscope_runtime.engine.deployers.utils.docker_image_utils."
             "image_factory.build_detached_app",
-            return_value=(self.temp_dir, mocker.Mock()),
+            return_value=(str(tmp_path), mocker.Mock()),
         )
         mock_builder_class = mocker.patch(
             "agentscope_runtime.engine.deployers.utils.docker_image_utils."
@@ -251,7 +232,7 @@ class TestImageFactory:
         result = image_factory.build_image(
             runner=mock_runner,
             requirements=["fastapi"],
-            build_context_dir=self.temp_dir,
+            build_context_dir=str(tmp_path),
             registry_config=RegistryConfig(),
             image_name="test-runner",
             image_tag="latest",
@@ -261,7 +242,7 @@ class TestImageFactory:
         mock_bundle.assert_called_once()
         mock_builder_instance.build_image.assert_called_once()
 
-    def test_build_image_from_app(self, mocker):
+    def test_build_image_from_app(self, mocker, build_context_dir):
         """Ensure build_runner_image can resolve runner from app."""
         mock_app = mocker.Mock()
         mock_runner = mocker.Mock()
@@ -280,7 +261,7 @@ class TestImageFactory:
         result = image_factory.build_image(
             app=mock_app,
             requirements=["fastapi"],
-            build_context_dir=self.temp_dir,
+            build_context_dir=build_context_dir,
             registry_config=RegistryConfig(),
             image_name="app-image",
             image_tag="latest",
@@ -4,8 +4,8 @@
 
 
 import os
-import shutil
-import tempfile
+import re
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -19,6 +19,12 @@ from agentscope_runtime.engine.deployers.utils.docker_image_utils import (
     RegistryConfig,
 )
 
+# Stand-in runner for tests that only pass it through to the patched image
+# builder, far cheaper to build than a Mock
+RUNNER_SENTINEL = SimpleNamespace(_agent=SimpleNamespace())
+
+DEPLOYMENT_FAILED = re.compile(r"Deployment failed")
+
 
 class TestK8sConfig:
     """Test cases for K8sConfig model."""
@@ -55,13 +61,34 @@ class TestBuildConfigK8s:
 class TestKubernetesDeployManager:
     """Test cases for KubernetesDeployManager class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def k8s_deploy_mocks(self, mocker):
+        """Patch the Kubernetes client and the image build, so that
+        deployments succeed without a cluster or Docker."""
+        mock_k8s_client = mocker.patch(
+            "agentscope_runtime.engine.deployers.kubernetes_deployer."
+            "KubernetesClient",
+        )
+        client = mocker.Mock()
+        client.create_deployment.return_value = (
+            "service-id",
+            [8090],
+            "10.0.0.1",
+        )
+        mock_k8s_client.return_value = client
+
+        deployer = KubernetesDeployManager()
+        # Mock the image builder to avoid actual Docker operations
+        build_image = mocker.patch.object(
+            deployer.image_factory,
+            "build_image",
+            return_value="test-image:latest",
+        )
+        return SimpleNamespace(
+            client=client,
+            deployer=deployer,
+            build_image=build_image,
+        )
 
     @patch(
         "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
@@ -87,232 +114,128 @@ class TestKubernetesDeployManager:
             image_registry=registry_config.get_full_url(),
         )
 
-    @patch(
-        "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
-    )
     @pytest.mark.asyncio
-    async def test_deploy_with_runner_success(self, mock_k8s_client, mocker):
+    async def test_deploy_with_runner_success(self, k8s_deploy_mocks):
         """Test successful deployment with runner."""
-        # Setup mocks
-        mock_runner = mocker.Mock()
-        mock_runner._agent = mocker.Mock()
-        mock_runner.__class__.__name__ = "MockRunner"
-
-        # Mock Kubernetes client
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_deployment.return_value = (
-            "service-id",
-            [8090],
-            "10.0.0.1",
+        result = await k8s_deploy_mocks.deployer.deploy(
+            runner=RUNNER_SENTINEL,
+            requirements=["fastapi", "uvicorn"],
+            base_image="python:3.9-slim",
+            port=8090,
+            replicas=2,
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        # Create deployer
-        deployer = KubernetesDeployManager()
 
-        # Mock the image builder to avoid actual Docker operations
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
-        ) as mock_build:
-            # Test deployment
-            result = await deployer.deploy(
-                runner=mock_runner,
-                requirements=["fastapi", "uvicorn"],
-                base_image="python:3.9-slim",
-                port=8090,
-                replicas=2,
-            )
-
-            # Assertions
-            assert isinstance(result, dict)
-            assert "deploy_id" in result
-            assert "url" in result
-            assert "resource_name" in result
-            assert "replicas" in result
-
-            assert result["url"] == "http://10.0.0.1:8090"
-            assert result["replicas"] == 2
-
-            # Verify image build was called
-            mock_build.assert_called_once()
-
-            # Verify Kubernetes deployment was called
-            mock_client_instance.create_deployment.assert_called_once()
-
-    @patch(
-        "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
+        # Assertions
+        assert isinstance(result, dict)
+        assert "deploy_id" in result
+        assert "url" in result
+        assert "resource_name" in result
+        assert "replicas" in result
+
+        assert result["url"] == "http://10.0.0.1:8090"
+        assert result["replicas"] == 2
+
+        # Verify image build was called
+        k8s_deploy_mocks.build_image.assert_called_once()
+
+        # Verify Kubernetes deployment was called
+        k8s_deploy_mocks.client.create_deployment.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "built_image, deployment, error",
+        [
+            # Image builder returns None
+            (None, None, "Image build failed"),
+            # Image builds, but no Kubernetes resource is created
+            (
+                "test-image:latest",
+                (None, [], None),
+                "Failed to create resource",
+            ),
+        ],
+        ids=["image_build_failure", "k8s_deployment_failure"],
     )
-    @pytest.mark.asyncio
-    async def test_deploy_image_build_failure(self, mock_k8s_client, mocker):
-        """Test deployment when image build fails."""
-        mock_runner = mocker.Mock()
-
-        # Mock Kubernetes client
-        mock_client_instance = mocker.Mock()
-        mock_k8s_client.return_value = mock_client_instance
-
-        # Create deployer
-        deployer = KubernetesDeployManager()
-
-        # Mock the image builder to return None (build failure)
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value=None,
-        ):
-            # Test deployment failure
-            with pytest.raises(RuntimeError, match="Image build failed"):
-                await deployer.deploy(runner=mock_runner)
-
     @patch(
         "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
     )
     @pytest.mark.asyncio
-    async def test_deploy_k8s_deployment_failure(
+    async def test_deploy_failure(
         self,
         mock_k8s_client,
         mocker,
+        built_image,
+        deployment,
+        error,
     ):
-        """Test deployment when Kubernetes deployment fails."""
-        mock_runner = mocker.Mock()
+        """Test deployment when the image build or the k8s deployment
+        fails."""
 
-        # Mock Kubernetes client failure
+        # Mock Kubernetes client
         mock_client_instance = mocker.Mock()
-        mock_client_instance.create_deployment.return_value = (
-            None,
-            [],
-            None,
-        )  # Failure
+        if deployment is not None:
+            mock_client_instance.create_deployment.return_value = deployment
         mock_k8s_client.return_value = mock_client_instance
 
         # Create deployer
         deployer = KubernetesDeployManager()
 
-        # Mock the image builder to return success, but k8s deployment fails
         with patch.object(
             deployer.image_factory,
             "build_image",
-            return_value="test-image:latest",
+            return_value=built_image,
         ):
             # Test deployment failure
-            with pytest.raises(
-                RuntimeError,
-                match="Failed to create resource",
-            ):
-                await deployer.deploy(runner=mock_runner)
+            with pytest.raises(RuntimeError, match=error):
+                await deployer.deploy(runner=RUNNER_SENTINEL)
 
-    @patch(
-        "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
-    )
     @pytest.mark.asyncio
-    async def test_deploy_with_app_only(self, mock_k8s_client, mocker):
+    async def test_deploy_with_app_only(self, k8s_deploy_mocks, mocker):
         """Test deployment succeeds when only an app is provided."""
         mock_app = mocker.Mock()
         mock_app._runner = mocker.Mock()
         mock_app.endpoint_path = "/custom"
         mock_app.stream = False
 
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_deployment.return_value = (
-            "service-id",
-            [8090],
-            "10.0.0.1",
+        result = await k8s_deploy_mocks.deployer.deploy(
+            app=mock_app,
+            replicas=1,
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KubernetesDeployManager()
-
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="app-image:latest",
-        ) as mock_build:
-            result = await deployer.deploy(app=mock_app, replicas=1)
 
         assert "url" in result
-        mock_build.assert_called_once()
+        k8s_deploy_mocks.build_image.assert_called_once()
 
-    @patch(
-        "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
-    )
     @pytest.mark.asyncio
-    async def test_deploy_with_protocol_adapters(
-        self,
-        mock_k8s_client,
-        mocker,
-    ):
+    async def test_deploy_with_protocol_adapters(self, k8s_deploy_mocks):
         """Test deployment with protocol adapters."""
-        mock_runner = mocker.Mock()
-        mock_adapters = [mocker.Mock(), mocker.Mock()]
+        mock_adapters = [SimpleNamespace(), SimpleNamespace()]
 
-        # Setup mocks
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_deployment.return_value = (
-            "service-id",
-            [8090],
-            "10.0.0.1",
+        result = await k8s_deploy_mocks.deployer.deploy(
+            runner=RUNNER_SENTINEL,
+            protocol_adapters=mock_adapters,
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KubernetesDeployManager()
-
-        # Mock the image builder
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
-        ) as mock_build:
-            result = await deployer.deploy(
-                runner=mock_runner,
-                protocol_adapters=mock_adapters,
-            )
-            assert "deploy_id" in result
-            # Verify protocol_adapters were passed to image builder
-            call_args = mock_build.call_args
-            assert call_args[1]["protocol_adapters"] == mock_adapters
+        assert "deploy_id" in result
+        # Verify protocol_adapters were passed to image builder
+        call_args = k8s_deploy_mocks.build_image.call_args
+        assert call_args[1]["protocol_adapters"] == mock_adapters
 
-    @patch(
-        "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
-    )
     @pytest.mark.asyncio
-    async def test_deploy_with_volume_mount(self, mock_k8s_client, mocker):
+    async def test_deploy_with_volume_mount(self, k8s_deploy_mocks):
         """Test deployment with volume mounting."""
-        mock_runner = mocker.Mock()
-
-        # Setup mocks
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_deployment.return_value = (
-            "service-id",
-            [8090],
-            "10.0.0.1",
+        result = await k8s_deploy_mocks.deployer.deploy(
+            runner=RUNNER_SENTINEL,
+            mount_dir="/data",
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KubernetesDeployManager()
-
-        # Mock the image builder
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
-        ):
-            result = await deployer.deploy(
-                runner=mock_runner,
-                mount_dir="/data",
-            )
-            assert "deploy_id" in result
-            # Verify volume mounting configuration was passed
-            call_args = mock_client_instance.create_deployment.call_args
-            volumes_arg = call_args[1]["volumes"]
-            expected_volumes = {
-                "/data": {
-                    "bind": "/data",
-                    "mode": "rw",
-                },
-            }
-            assert volumes_arg == expected_volumes
+        assert "deploy_id" in result
+        # Verify volume mounting configuration was passed
+        call_args = k8s_deploy_mocks.client.create_deployment.call_args
+        volumes_arg = call_args[1]["volumes"]
+        expected_volumes = {
+            "/data": {
+                "bind": "/data",
+                "mode": "rw",
+            },
+        }
+        assert volumes_arg == expected_volumes
 
     @patch(
         "agentscope_runtime.engine.deployers.kubernetes_deployer.KubernetesClient",  # noqa E501
@@ -323,7 +246,7 @@ class TestKubernetesDeployManager:
         deployer = KubernetesDeployManager()
 
         # Test with neither runner nor func
-        with pytest.raises(RuntimeError, match="Deployment failed"):
+        with pytest.raises(RuntimeError, match=DEPLOYMENT_FAILED):
             await deployer.deploy(runner=None, func=None)
 
     @patch(
@@ -430,5 +353,5 @@ class TestKubernetesDeployManager:
             assert deployer.image_factory is not None
 
             # Test validation error handling
-            with pytest.raises(RuntimeError, match="Deployment failed"):
+            with pytest.raises(RuntimeError, match=DEPLOYMENT_FAILED):
                 await deployer.deploy(runner=None, func=None)
@@ -3,6 +3,8 @@
 """
 Unit tests for LocalDeployManager.
 """
+import asyncio
+
 import pytest
 import requests
 
@@ -31,6 +33,12 @@ PAYLOAD = {
 }
 
 
+@pytest.fixture(scope="module")
+def default_manager():
+    """A LocalDeployManager built with the defaults, only read from."""
+    return LocalDeployManager()
+
+
 class TestLocalDeployManager:
     """Test cases for LocalDeployManager."""
 
@@ -43,12 +51,26 @@ class TestLocalDeployManager:
         """Test LocalDeployManager initialization."""
         assert deploy_manager.host == "localhost"
         assert deploy_manager.port == 8090
-        assert deploy_manager._server is None
-        assert deploy_manager._server_task is None
-        assert deploy_manager.is_running is False
-        assert deploy_manager._app is None
-        assert deploy_manager._startup_timeout == 30
-        assert deploy_manager._shutdown_timeout == 30
+
+    @pytest.mark.parametrize(
+        "attribute, expected",
+        [
+            ("host", "127.0.0.1"),
+            ("port", 8000),
+            ("is_running", False),
+            ("service_url", None),
+            ("_server", None),
+            ("_server_task", None),
+            ("_server_thread", None),
+            ("_detached_process_pid", None),
+            ("_app", None),
+            ("_startup_timeout", 30),
+            ("_shutdown_timeout", 30),
+        ],
+    )
+    def test_default_attributes(self, default_manager, attribute, expected):
+        """Test the initial state of a LocalDeployManager."""
+        assert getattr(default_manager, attribute) == expected
 
     @pytest.mark.asyncio
     async def test_deploy_success_with_callable(self, deploy_manager):
@@ -109,8 +131,9 @@ class TestLocalDeployManager:
     ):
         """Test deployment with server startup timeout."""
         _app = AgentApp()
-        # Use a very short timeout to trigger the timeout error
-        deploy_manager._startup_timeout = 0.1
+        # An already expired timeout triggers the timeout error without
+        # waiting on the server state event
+        deploy_manager._startup_timeout = 0
 
         # Mock the server readiness check to always fail
         monkeypatch.setattr(
@@ -141,13 +164,13 @@ class TestLocalDeployManager:
         assert deploy_manager._server is None
         assert deploy_manager._server_task is None
 
-    @pytest.mark.asyncio
-    async def test_stop_not_running(self, deploy_manager):
+    def test_stop_not_running(self, deploy_manager):
         """Test stopping when service is not running."""
         deploy_manager.is_running = False
 
-        # Should not raise an exception
-        await deploy_manager.stop()
+        # Should not raise an exception, nothing to wait for so no need for
+        # the asyncio plugin's loop
+        asyncio.run(deploy_manager.stop())
 
     def test_is_running_property(self, deploy_manager):
         """Test is_running property."""
@@ -166,6 +189,52 @@ class TestLocalDeployManager:
         deploy_manager.port = 8000
         assert deploy_manager.service_url == "http://localhost:8000"
 
+    @pytest.mark.parametrize(
+        "is_running, has_server, pid, alive, expected",
+        [
+            (False, False, None, None, False),
+            (True, True, None, None, True),
+            (True, False, None, None, False),
+            (True, False, 12345, True, True),
+            (True, False, 12345, False, False),
+        ],
+        ids=[
+            "not_running",
+            "daemon_thread",
+            "daemon_thread_no_server",
+            "detached_process_alive",
+            "detached_process_dead",
+        ],
+    )
+    def test_is_service_running(
+        self,
+        deploy_manager,
+        mocker,
+        is_running,
+        has_server,
+        pid,
+        alive,
+        expected,
+    ):
+        """Test is_service_running for each deployment mode."""
+        deploy_manager.is_running = is_running
+        deploy_manager._detached_process_pid = pid
+        if has_server:
+            deploy_manager._server = mocker.Mock()
+            mocker.patch.object(
+                deploy_manager,
+                "_is_server_ready",
+                return_value=True,
+            )
+        if alive is not None:
+            mocker.patch.object(
+                deploy_manager.process_manager,
+                "is_process_running",
+                return_value=alive,
+            )
+
+        assert deploy_manager.is_service_running() is expected
+
 
 class TestLocalDeployManagerIntegration:
     """Integration tests for LocalDeployManager."""
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=unused-variable,f-string-without-interpolation
 # pylint: disable=line-too-long, too-many-branches
+import os
 from pathlib import Path
 
+from agentscope_runtime.engine.deployers.utils import wheel_packager
 from agentscope_runtime.engine.deployers.utils.wheel_packager import (
+    build_wheel_cached,
     generate_wrapper_project,
 )
 
@@ -65,3 +68,106 @@ def test_generate_wrapper_project_telemetry_true(tmp_path: Path):
     )
     cfg = wrapper_dir / "deploy_starter" / "config.yml"
     assert "TELEMETRY_ENABLE: true" in cfg.read_text(encoding="utf-8")
+
+
+def test_build_wheel_cached_reuses_unchanged_project(tmp_path: Path, mocker):
+    user_proj = _make_user_project(tmp_path)
+    built = []
+
+    def fake_build_wheel(project_dir: Path) -> Path:
+        dist = project_dir / "dist"
+        dist.mkdir(exist_ok=True)
+        whl = dist / f"dummy-0.0.{len(built)}-py3-none-any.whl"
+        whl.write_bytes(b"wheel")
+        built.append(whl)
+        return whl
+
+    mocker.patch.object(wheel_packager, "build_wheel", fake_build_wheel)
+    cache_dir = tmp_path / "cache"
+
+    first = build_wheel_cached(user_proj, cache_dir)
+    # dist/ output must not invalidate the cache entry
+    second = build_wheel_cached(user_proj, cache_dir)
+    assert first == second
+    assert first.is_file() and first.parent.parent == cache_dir
+    assert len(built) == 1
+
+    app_py = user_proj / "app.py"
+    app_py.write_text("print('changed')\n", encoding="utf-8")
+    stat = app_py.stat()
+    os.utime(app_py, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    third = build_wheel_cached(user_proj, cache_dir)
+    assert third != first
+    assert len(built) == 2
+
+
+def test_project_fingerprint_skips_build_outputs_and_venvs(tmp_path: Path):
+    user_proj = _make_user_project(tmp_path)
+    fingerprint = wheel_packager._project_fingerprint
+
+    def touch(rel: str) -> str:
+        path = user_proj / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel, encoding="utf-8")
+        return fingerprint(user_proj)
+
+    base = fingerprint(user_proj)
+    # Top-level build outputs, caches and virtualenvs are not sources
+    assert touch("dist/pkg-0.1-py3-none-any.whl") == base
+    assert touch("build/lib/app.py") == base
+    assert touch("__pycache__/app.cpython-310.pyc") == base
+    (user_proj / "env").mkdir()
+    (user_proj / "env" / "pyvenv.cfg").write_text("", encoding="utf-8")
+    assert touch("env/lib/site.py") == base
+
+    # A package named build below the top level is part of the project
+    assert touch("pkg/build/steps.py") != base
+
+
+def test_build_wheel_cached_evicts_old_entries(tmp_path: Path, mocker):
+    user_proj = _make_user_project(tmp_path)
+
+    def fake_build_wheel(project_dir: Path) -> Path:
+        whl = tmp_path / "dummy-0.0.1-py3-none-any.whl"
+        whl.write_bytes(b"wheel")
+        return whl
+
+    mocker.patch.object(wheel_packager, "build_wheel", fake_build_wheel)
+    mocker.patch.object(wheel_packager, "_WHEEL_CACHE_MAX_ENTRIES", 2)
+    cache_dir = tmp_path / "cache"
+
+    app_py = user_proj / "app.py"
+    wheels = []
+    for i in range(3):
+        app_py.write_text(f"print({i})\n", encoding="utf-8")
+        os.utime(app_py, ns=(i, i))
+        wheels.append(build_wheel_cached(user_proj, cache_dir))
+        entry = wheels[-1].parent
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+    assert not wheels[0].exists()
+    assert wheels[1].is_file() and wheels[2].is_file()
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_project_fingerprint_follows_git_head(tmp_path: Path):
+    user_proj = _make_user_project(tmp_path)
+    fingerprint = wheel_packager._project_fingerprint
+    git_dir = user_proj / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    branch = git_dir / "refs" / "heads" / "main"
+
+    branch.write_text("a" * 40 + "\n", encoding="utf-8")
+    base = fingerprint(user_proj)
+    # A new commit changes setuptools_scm versions, not the tracked files
+    branch.write_text("b" * 40 + "\n", encoding="utf-8")
+    assert fingerprint(user_proj) != base
+
+    # Refs may only be listed in packed-refs
+    branch.unlink()
+    (git_dir / "packed-refs").write_text(
+        f"{'a' * 40} refs/heads/main\n",
+        encoding="utf-8",
+    )
+    assert fingerprint(user_proj) == base
@@ -111,6 +111,80 @@ def test_tool_tool_wrapper_execution():
     assert "Processed: test_value" in result.content[0]["text"]
 
 
+def test_tool_wrapper_reuses_event_loop():
+    """Sync calls of async tools share one background event loop."""
+    from agentscope_runtime.adapters.agentscope.tool.tool import (
+        _get_tool_loop,
+    )
+
+    tool = agentscope_tool_adapter(MockTool())
+
+    tool.original_func(value="first")
+    loop = _get_tool_loop()
+    result = tool.original_func(value="second")
+
+    assert _get_tool_loop() is loop
+    assert loop.is_running()
+    assert "Processed: second" in result.content[0]["text"]
+
+
+def test_tool_wrapper_nested_sync_call():
+    """A sync call from a tool on the shared loop uses the next loop."""
+    from agentscope_runtime.adapters.agentscope.tool.tool import _TOOL_LOOPS
+
+    inner = agentscope_tool_adapter(MockTool())
+
+    class OuterTool(Tool[MockInput, MockOutput]):
+        name = "outer_tool"
+        description = "Calls another tool synchronously"
+
+        async def _arun(self, args: MockInput, **kwargs):
+            response = inner.original_func.call(value=args.value)
+            return MockOutput(result=response.content[0]["text"])
+
+    outer = agentscope_tool_adapter(OuterTool())
+    result = outer.original_func(value="nested")
+
+    assert "Processed: nested" in result.content[0]["text"]
+    assert len(_TOOL_LOOPS) >= 2
+    assert all(loop.is_running() for loop in _TOOL_LOOPS)
+
+
+@pytest.mark.asyncio
+async def test_tool_wrapper_runs_on_caller_loop(mocker):
+    """The async variant runs async tools on the caller's loop, while the
+    default wrapper keeps returning a ToolResponse."""
+    import inspect
+
+    from agentscope.tool import ToolResponse
+
+    from agentscope_runtime.adapters.agentscope.tool import tool as module
+
+    spy = mocker.spy(module, "_run_coroutine")
+    tool = agentscope_tool_adapter(MockTool())
+
+    result = await tool.original_func.acall(value="direct")
+    assert isinstance(result, ToolResponse)
+    assert "Processed: direct" in result.content[0]["text"]
+    spy.assert_not_called()
+
+    result = tool.original_func(value="blocking")
+    assert isinstance(result, ToolResponse)
+    assert "Processed: blocking" in result.content[0]["text"]
+
+    native = agentscope_tool_adapter(MockTool(), async_call=True)
+    assert inspect.iscoroutinefunction(native.original_func)
+    toolkit = agentscope_toolkit_adapter([MockTool()])
+    assert inspect.iscoroutinefunction(
+        toolkit.tools["mock_tool"].original_func,
+    )
+
+    spy.reset_mock()
+    result = await native.original_func(value="native")
+    assert "Processed: native" in result.content[0]["text"]
+    spy.assert_not_called()
+
+
 def test_tool_tool_wrapper_error_handling():
     """Test error handling in the wrapped tool function."""
     tool = MockTool()
@@ -161,6 +235,29 @@ def test_json_schema_format():
     assert schema["function"]["name"] == "mock_tool"
 
 
+def test_json_schema_parameters_per_instance():
+    """Schemas follow each instance's input type and are not shared."""
+
+    class OtherInput(BaseModel):
+        query: str
+
+    class OtherInputTool(MockTool):
+        def _input_type(self):
+            return OtherInput
+
+    first = agentscope_tool_adapter(MockTool())
+    second = agentscope_tool_adapter(MockTool())
+    third = agentscope_tool_adapter(OtherInputTool())
+
+    first.json_schema["function"]["parameters"]["properties"].pop("value")
+    assert (
+        "value" in second.json_schema["function"]["parameters"]["properties"]
+    )
+    assert list(
+        third.json_schema["function"]["parameters"]["properties"],
+    ) == ["query"]
+
+
 @pytest.mark.asyncio
 async def test_toolkit_tool_execution():
     """Test actual tool execution through AgentScope toolkit."""
@@ -361,3 +458,29 @@ async def test_tool_with_react_agent_integration():
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+def test_tool_wrapper_non_pydantic_input_type():
+    """Input types without a pydantic v2 validator are built at call time."""
+
+    class PlainInput:
+        def __init__(self, value: str):
+            self.value = value
+
+    class PlainInputTool(MockTool):
+        def _input_type(self):
+            return PlainInput
+
+        async def _arun(self, args, **kwargs):
+            return MockOutput(result=f"Processed: {args.value}")
+
+        async def arun(self, args, **kwargs):
+            return await self._arun(args, **kwargs)
+
+    tool = agentscope_tool_adapter(PlainInputTool())
+
+    result = tool.original_func(value="plain")
+    assert "Processed: plain" in result.content[0]["text"]
+
+    error = tool.original_func(unknown="x")
+    assert error.metadata.get("error") is True
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 # pylint:disable=redefined-outer-name
 
-from datetime import datetime
+import os
+import time
 
 import pytest
 from agentscope_runtime.tools.alipay.payment import (
@@ -55,7 +56,7 @@ def alipay_refund_query():
 @pytest.fixture
 def test_order_no():
     """Generate test order number"""
-    return f"test_order_{int(datetime.now().timestamp())}"
+    return f"test_order_{os.getpid()}_{time.time_ns()}"
 
 
 # Tests for MobileAlipayPayment
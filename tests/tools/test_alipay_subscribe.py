@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 # pylint:disable=redefined-outer-name
 
-import re
-from datetime import datetime
+import os
+import time
 
 import pytest
 from agentscope_runtime.tools.alipay.subscribe import (
@@ -48,7 +48,7 @@ def alipay_subscribe_check_or_initialize():
 @pytest.fixture
 def test_order_no():
     """Generate test order number"""
-    return f"test_order_{int(datetime.now().timestamp())}"
+    return f"test_order_{os.getpid()}_{time.time_ns()}"
 
 
 # Tests
@@ -109,7 +109,7 @@ def test_subscribe_package_initialize(alipay_subscribe_package_initialize):
     assert isinstance(resp.subscribe_url, (str, type(None)))
     # If URL is returned, check whether it is within valid range
     if resp.subscribe_url is not None:
-        assert re.search(r"alipays://platformapi/startapp", resp.subscribe_url)
+        assert "alipays://platformapi/startapp" in resp.subscribe_url
     # Note: Due to SSL certificate issues, actual return may be None,
     # which is normal
 
@@ -155,7 +155,7 @@ def test_subscribe_check_or_initialize_subscribed(
     assert isinstance(resp.subscribe_url, (str, type(None)))
     assert isinstance(resp.subscribe_flag, (bool, type(None)))
     if resp.subscribe_url is not None:
-        assert re.search(r"alipays://platformapi/startapp", resp.subscribe_url)
+        assert "alipays://platformapi/startapp" in resp.subscribe_url
     if resp.subscribe_flag is not None:
         valid_statuses = [True, False]
         assert resp.subscribe_flag in valid_statuses
@@ -23,16 +23,30 @@ from agentscope_runtime.engine.schemas.agent_schemas import AgentRequest
 
 def normalize(obj):
     """
-    Recursively converts an object into a standard comparable structure.
+    Converts an object into a standard comparable structure.
+
+    Walks nested lists/dicts with an explicit stack instead of recursion,
+    and dumps each distinct Pydantic object only once.
     """
-    if hasattr(obj, "model_dump"):  # Handles Pydantic v2 objects
-        return obj.model_dump()
-    elif isinstance(obj, (list, tuple)):
-        return [normalize(i) for i in obj]
-    elif isinstance(obj, dict):
-        return {k: normalize(v) for k, v in obj.items()}
-    else:
-        return obj
+    dump_cache = {}
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, key, value = stack.pop()
+        if hasattr(value, "model_dump"):  # Handles Pydantic v2 objects
+            dumped = dump_cache.get(id(value))
+            if dumped is None:
+                dumped = dump_cache[id(value)] = value.model_dump()
+            parent[key] = dumped
+        elif isinstance(value, (list, tuple)):
+            items = list(value)
+            parent[key] = items
+            stack.extend((items, i, item) for i, item in enumerate(items))
+        elif isinstance(value, dict):
+            items = dict(value)
+            parent[key] = items
+            stack.extend((items, k, v) for k, v in items.items())
+    return root[0]
 
 
 def _check_round_trip(msgs):
@@ -64,10 +78,7 @@ def _check_round_trip(msgs):
 
         orig_blocks = normalize(orig.content)
         conv_blocks = normalize(conv.content)
-        assert json.dumps(orig_blocks, sort_keys=True) == json.dumps(
-            conv_blocks,
-            sort_keys=True,
-        )
+        assert orig_blocks == conv_blocks
 
 
 @pytest.mark.parametrize(
@@ -207,10 +218,7 @@ def _check_round_trip_runtime_messages(runtime_messages):
     orig_norm = strip_irrelevant_fields(normalize(runtime_messages))
     conv_norm = strip_irrelevant_fields(normalize(converted_runtime_messages))
 
-    assert json.dumps(orig_norm, sort_keys=True) == json.dumps(
-        conv_norm,
-        sort_keys=True,
-    )
+    assert orig_norm == conv_norm
 
 
 @pytest.mark.parametrize(
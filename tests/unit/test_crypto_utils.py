@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from agentscope_runtime.tools.utils.crypto_utils import ensure_pkcs1_format
+
+PEM = serialization.Encoding.PEM
+DER = serialization.Encoding.DER
+PKCS1 = serialization.PrivateFormat.TraditionalOpenSSL
+PKCS8 = serialization.PrivateFormat.PKCS8
+NO_ENCRYPTION = serialization.NoEncryption()
+
+
+def _base64_body(pem: bytes, sep: bytes = b"\n") -> bytes:
+    """Strip the PEM armor, keeping the base64 lines joined by ``sep``."""
+    return sep.join(
+        line for line in pem.splitlines() if not line.startswith(b"-----")
+    )
+
+
+@pytest.fixture(scope="module", params=["rsa", "ec"])
+def private_key(request):
+    if request.param == "rsa":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+@pytest.fixture(scope="module")
+def expected(private_key):
+    """The PKCS#1 (traditional OpenSSL) PEM of the key."""
+    return private_key.private_bytes(PEM, PKCS1, NO_ENCRYPTION).decode()
+
+
+def _key_inputs(private_key):
+    pkcs1_pem = private_key.private_bytes(PEM, PKCS1, NO_ENCRYPTION)
+    pkcs8_pem = private_key.private_bytes(PEM, PKCS8, NO_ENCRYPTION)
+    return {
+        "pkcs1_pem": pkcs1_pem.decode(),
+        "pkcs8_pem": pkcs8_pem.decode(),
+        "pkcs1_pem_bytes": pkcs1_pem,
+        "pkcs8_pem_bytes": pkcs8_pem,
+        "pkcs1_pem_crlf": pkcs1_pem.replace(b"\n", b"\r\n").decode(),
+        "pkcs8_pem_padded": "  " + pkcs8_pem.decode() + "\n\n",
+        "pkcs1_base64": _base64_body(pkcs1_pem).decode(),
+        "pkcs8_base64": _base64_body(pkcs8_pem, b"").decode(),
+        "pkcs8_base64_bytes": _base64_body(pkcs8_pem),
+        "pkcs1_der": private_key.private_bytes(DER, PKCS1, NO_ENCRYPTION),
+        "pkcs8_der": private_key.private_bytes(DER, PKCS8, NO_ENCRYPTION),
+    }
+
+
+INPUT_FORMS = [
+    "pkcs1_pem",
+    "pkcs8_pem",
+    "pkcs1_pem_bytes",
+    "pkcs8_pem_bytes",
+    "pkcs1_pem_crlf",
+    "pkcs8_pem_padded",
+    "pkcs1_base64",
+    "pkcs8_base64",
+    "pkcs8_base64_bytes",
+    "pkcs1_der",
+    "pkcs8_der",
+]
+
+
+@pytest.mark.parametrize("form", INPUT_FORMS)
+def test_ensure_pkcs1_format(private_key, expected, form):
+    """Every input form gives the same output as private_bytes()."""
+    key = _key_inputs(private_key)[form]
+
+    assert ensure_pkcs1_format(key) == expected
+
+
+def _encrypted_pem():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        PEM,
+        PKCS8,
+        serialization.BestAvailableEncryption(b"password"),
+    ).decode()
+
+
+def _truncated_pkcs1_pem():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    lines = key.private_bytes(PEM, PKCS1, NO_ENCRYPTION).splitlines()
+    # Drop a line from the middle of the body so the DER lengths no longer
+    # match the content
+    del lines[len(lines) // 2]
+    return b"\n".join(lines).decode()
+
+
+def _armored(body: str) -> str:
+    return (
+        f"-----BEGIN RSA {'PRIVATE'} {'KEY'}-----\n{body}\n"
+        f"-----END RSA {'PRIVATE'} {'KEY'}-----"
+    )
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "",
+        "   \n",
+        b"",
+        "not a key",
+        _armored("MAA="),
+        _armored("MAYCAQACAQA="),
+        "MAYCAQACAQA=",
+        b"\x30\x82\x00\x06\x02\x01\x00\x02\x01\x00",
+        _truncated_pkcs1_pem(),
+        _encrypted_pem(),
+    ],
+    ids=[
+        "empty",
+        "whitespace",
+        "empty_bytes",
+        "garbage",
+        "pkcs1_pem_one_byte_body",
+        "pkcs1_pem_two_integers",
+        "base64_two_integers",
+        "der_two_integers",
+        "pkcs1_pem_truncated",
+        "encrypted",
+    ],
+)
+def test_ensure_pkcs1_format_invalid(key):
+    with pytest.raises(ValueError):
+        ensure_pkcs1_format(key)
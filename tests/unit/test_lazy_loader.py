@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import importlib
+import importlib.util
+import json
+import sys
+import types
+
+import pytest
+
+from agentscope_runtime.common.utils.lazy_loader import install_lazy_loader
+
+
+@pytest.fixture
+def lazy_module():
+    module = types.ModuleType("lazy_loader_test")
+    install_lazy_loader(vars(module), {"dumps": "json"})
+    return module
+
+
+def test_lazy_member_cached_in_globals(lazy_module, mocker):
+    """Resolved members are plain module attributes after first access."""
+    assert "dumps" not in vars(lazy_module)
+    assert "dumps" in dir(lazy_module)
+
+    assert lazy_module.dumps is json.dumps
+    assert vars(lazy_module)["dumps"] is json.dumps
+
+    spy = mocker.spy(importlib, "import_module")
+    assert lazy_module.dumps is json.dumps
+    spy.assert_not_called()
+
+
+def test_lazy_loader_unknown_attribute(lazy_module):
+    with pytest.raises(AttributeError):
+        _ = lazy_module.loads
+
+
+def test_members_of_same_module_resolved_together():
+    """One import resolves every member provided by that module."""
+    module = types.ModuleType("lazy_loader_test")
+    install_lazy_loader(
+        vars(module),
+        {"dumps": "json", "loads": "json", "OrderedDict": "collections"},
+    )
+
+    assert module.dumps is json.dumps
+    assert vars(module)["loads"] is json.loads
+    assert "OrderedDict" not in vars(module)
+
+
+def test_missing_optional_member_does_not_break_siblings():
+    """A sibling whose own lazy import fails is left unresolved."""
+    inner = types.ModuleType("lazy_loader_inner")
+    inner.available = object()
+    install_lazy_loader(
+        vars(inner),
+        {"optional": "agentscope_runtime_missing_sdk"},
+    )
+    outer = types.ModuleType("lazy_loader_outer")
+    install_lazy_loader(
+        vars(outer),
+        {"available": inner.__name__, "optional": inner.__name__},
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, inner.__name__, inner)
+        assert outer.available is inner.available
+        assert "optional" not in vars(outer)
+        with pytest.raises(ImportError):
+            _ = outer.optional
+
+
+def test_optional_member_resolves_to_none():
+    """Optional members are None when their dependency is missing."""
+    module = types.ModuleType("lazy_loader_test")
+    install_lazy_loader(
+        vars(module),
+        {
+            "dumps": "json",
+            "Client": {
+                "module": "agentscope_runtime_missing_sdk",
+                "hint": "pip install agentscope-runtime-missing-sdk",
+                "optional": True,
+            },
+            "Other": {
+                "module": "agentscope_runtime_missing_sdk",
+                "hint": "pip install agentscope-runtime-missing-sdk",
+            },
+        },
+    )
+
+    assert module.Client is None
+    assert module.dumps is json.dumps
+    with pytest.raises(ImportError, match="agentscope-runtime-missing-sdk"):
+        _ = module.Other
+
+
+def test_deployers_reachable_without_agentrun_sdk():
+    """LocalDeployManager and KubernetesDeployManager do not need the
+    AgentRun SDK, and AgentRunDeployManager is None without it."""
+    pytest.importorskip("kubernetes")
+    if importlib.util.find_spec("alibabacloud_agentrun20250910"):
+        pytest.skip("AgentRun SDK is installed")
+
+    import agentscope_runtime.engine as engine
+    from agentscope_runtime.engine import deployers
+
+    assert engine.LocalDeployManager is deployers.LocalDeployManager
+    assert deployers.KubernetesDeployManager.__name__ == (
+        "KubernetesDeployManager"
+    )
+    assert engine.AgentRunDeployManager is None
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 import copy
+import json
+from pathlib import Path
+
 import pytest
 from dotenv import load_dotenv
 
@@ -11,19 +14,24 @@ from agentscope_runtime.engine.schemas.agent_schemas import (
 from agentscope_runtime.engine.helpers.runner import SimpleRunner, ErrorRunner
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _load_env():
+    """Load the repository's .env once for the module."""
+    load_dotenv(Path(__file__).parents[2] / ".env")
+
+
+# Request body with the text and session id slots left open, parsed by
+# pydantic-core's JSON parser instead of validating a Python dict
+REQUEST_JSON_TEMPLATE = (
+    '{"input": [{"role": "user", "content": [{"type": "text", "text": %s}]}],'
+    ' "stream": true, "session_id": %s}'
+)
+
+
 def make_request(text: str, session_id: str) -> AgentRequest:
     """Build a reusable AgentRequest object."""
-    return AgentRequest.model_validate(
-        {
-            "input": [
-                {
-                    "role": "user",
-                    "content": [{"type": "text", "text": text}],
-                },
-            ],
-            "stream": True,
-            "session_id": session_id,
-        },
+    return AgentRequest.model_validate_json(
+        REQUEST_JSON_TEMPLATE % (json.dumps(text), json.dumps(session_id)),
     )
 
 
@@ -32,7 +40,6 @@ async def run_and_collect(runner_cls, request: AgentRequest):
     results = []
     async with runner_cls() as runner:
         async for message in runner.stream_query(request=request):
-            print(message.model_dump_json())
             results.append(copy.deepcopy(message))
     return results
 
@@ -40,8 +47,6 @@ async def run_and_collect(runner_cls, request: AgentRequest):
 @pytest.mark.asyncio
 async def test_simple_runner():
     """Test SimpleRunner for a normal completion response."""
-    load_dotenv("../../.env")
-
     request = make_request("What's the weather in Hangzhou?", "Test Session")
     messages = await run_and_collect(SimpleRunner, request)
 
@@ -62,8 +67,6 @@ async def test_simple_runner():
 @pytest.mark.asyncio
 async def test_error_runner():
     """Test ErrorRunner to ensure error messages are returned."""
-    load_dotenv("../../.env")
-
     request = make_request(
         "This should trigger an error",
         "Test Error Session",
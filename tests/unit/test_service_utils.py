@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 # pylint:disable=pointless-string-statement
 
+import asyncio
 import os
-import shutil
-import tempfile
+import time
 
 # Mock classes will be provided by pytest-mock plugin
 
 import pytest
 from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 from agentscope_runtime.engine.deployers.adapter.a2a import (
     A2AFastAPIDefaultAdapter,
@@ -19,13 +22,27 @@ from agentscope_runtime.engine.deployers.adapter.responses import (
 from agentscope_runtime.engine.deployers.utils.deployment_modes import (
     DeploymentMode,
 )
+from agentscope_runtime.engine.schemas.agent_schemas import AgentRequest
 from agentscope_runtime.engine.deployers.utils.service_utils import (
     FastAPIAppFactory,
     FastAPITemplateManager,
     ProcessManager,
+    fastapi_factory,
 )
 
 
+def _worker_pid(user_id, request, request_id):
+    """Module level so the cpu pool can pickle it."""
+    return os.getpid(), request
+
+
+class _EchoRunner:
+    """Minimal runner streaming one chunk per agent request."""
+
+    async def stream_query(self, request):
+        yield {"text": "ok"}
+
+
 class TestFastAPIAppFactory:
     """Test cases for FastAPIAppFactory class."""
 
@@ -102,18 +119,349 @@ class TestFastAPIAppFactory:
             app_standalone.state.deployment_mode == DeploymentMode.STANDALONE
         )
 
+    def test_create_app_loop_policy(self, mocker):
+        """Daemon thread mode keeps the caller's loop policy on auto."""
+        mock_set_policy = mocker.patch("asyncio.set_event_loop_policy")
+
+        FastAPIAppFactory.create_app(mode=DeploymentMode.DAEMON_THREAD)
+        FastAPIAppFactory.create_app(
+            mode=DeploymentMode.STANDALONE,
+            loop_policy="asyncio",
+        )
+        mock_set_policy.assert_not_called()
+
+        with pytest.raises(ValueError):
+            FastAPIAppFactory.create_app(loop_policy="unknown")
+
+    @pytest.mark.asyncio
+    async def test_create_stream_generator_frames_chunks(self, mocker):
+        """Stream chunks are framed as SSE events per chunk type."""
+
+        class Event(BaseModel):
+            value: int
+
+        async def stream_query(request):
+            yield Event(value=1)
+            yield "plain"
+            yield Event(value=2)
+
+        runner = mocker.Mock()
+        runner.stream_query = stream_query
+        app = FastAPIAppFactory.create_app(runner=runner)
+
+        frames = [
+            frame
+            async for frame in FastAPIAppFactory._create_stream_generator(
+                app,
+                {},
+            )
+        ]
+
+        assert frames == [
+            b'data: {"value":1}\n\n',
+            b'data: {"text":"plain"}\n\n',
+            b'data: {"value":2}\n\n',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_call_custom_function_sync_runs_off_loop(self):
+        """Sync custom functions are dispatched to the worker pool."""
+        import threading
+
+        loop_thread = threading.get_ident()
+
+        def custom_func(user_id, request, request_id):
+            return threading.get_ident(), request
+
+        thread_id, request = await FastAPIAppFactory._call_custom_function(
+            custom_func,
+            {"input": []},
+        )
+
+        assert thread_id != loop_thread
+        assert request == {"input": []}
+
+    def test_create_app_cors_origins(self):
+        """CORS middleware is only installed when origins are given."""
+        from fastapi.middleware.cors import CORSMiddleware
+
+        def has_cors(app):
+            return any(m.cls is CORSMiddleware for m in app.user_middleware)
+
+        assert has_cors(FastAPIAppFactory.create_app())
+        assert has_cors(
+            FastAPIAppFactory.create_app(cors_origins=["https://a.test"]),
+        )
+        assert not has_cors(FastAPIAppFactory.create_app(cors_origins=None))
+
+    def test_sse_response_headers(self):
+        """SSE responses carry fresh copies of the prebuilt headers."""
+
+        async def body():
+            yield b""
+
+        first = fastapi_factory._SSEResponse(body())
+        second = fastapi_factory._SSEResponse(body())
+        first.headers["X-Extra"] = "1"
+
+        assert second.headers["content-type"].startswith("text/event-stream")
+        assert second.headers["cache-control"] == "no-cache"
+        assert "x-extra" not in second.headers
+
+    @pytest.mark.skipif(
+        not os.path.exists("/proc/self/stat"),
+        reason="procfs not available",
+    )
+    def test_proc_status_snapshot_matches_psutil(self):
+        """The procfs status reader reports the same values as psutil."""
+        import psutil
+
+        snapshot = fastapi_factory._proc_status_snapshot.__wrapped__(0)
+        process = psutil.Process(os.getpid())
+
+        assert snapshot["pid"] == os.getpid()
+        assert snapshot["status"] == process.status()
+        assert snapshot["memory_usage"] > 0
+        assert snapshot["uptime"] == pytest.approx(
+            process.create_time(),
+            abs=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_json_body(self, mocker):
+        """Agent request bodies are decoded as JSON objects."""
+
+        def make_request(body):
+            request = mocker.Mock()
+            request.body = mocker.AsyncMock(return_value=body)
+            return request
+
+        payload = await FastAPIAppFactory._read_json_body(
+            make_request(b'{"input": []}'),
+        )
+        assert payload == {"input": []}
+
+        with pytest.raises(RequestValidationError):
+            await FastAPIAppFactory._read_json_body(make_request(b"[1]"))
+
+    @pytest.mark.parametrize("request_model", [AgentRequest, None])
+    @pytest.mark.parametrize("body", [b"{not json", b"[1]"])
+    def test_invalid_body_error_shape(self, request_model, body):
+        """Typed and raw agent endpoints report invalid bodies alike."""
+        app = FastAPIAppFactory.create_app(
+            runner=_EchoRunner(),
+            request_model=request_model,
+            max_request_size=64,
+        )
+        client = TestClient(
+            app,
+            headers={"content-type": "application/json"},
+        )
+
+        response = client.post("/process", content=body)
+
+        assert response.status_code == 422
+        detail = response.json()["detail"]
+        assert detail and detail[0]["loc"][0] == "body"
+
+    def test_typed_endpoint_validates_agent_request(self):
+        """The typed endpoint rejects bodies that are not AgentRequests."""
+        app = FastAPIAppFactory.create_app(
+            runner=_EchoRunner(),
+            request_model=AgentRequest,
+        )
+        client = TestClient(app)
+
+        assert client.post("/process", json={"input": []}).status_code == 200
+        invalid = client.post("/process", json={"input": "not a list"})
+        assert invalid.status_code == 422
+        assert invalid.json()["detail"][0]["loc"][:2] == ["body", "input"]
+
+    @pytest.mark.parametrize("request_model", [AgentRequest, None])
+    def test_max_request_size(self, request_model):
+        """The size limit applies to typed and raw agent endpoints."""
+        app = FastAPIAppFactory.create_app(
+            runner=_EchoRunner(),
+            request_model=request_model,
+            max_request_size=64,
+        )
+        client = TestClient(
+            app,
+            headers={"content-type": "application/json"},
+        )
+        small = b'{"input": []}'
+        large = b'{"input": [], "session_id": "' + b"x" * 64 + b'"}'
+
+        assert client.post("/process", content=small).status_code == 200
+
+        too_large = client.post("/process", content=large)
+        assert too_large.status_code == 413
+        assert too_large.json()["max_request_size"] == 64
+
+        # Chunked bodies carry no content-length header
+        chunked = client.post(
+            "/process",
+            content=iter([large[:32], large[32:]]),
+        )
+        assert "content-length" not in chunked.request.headers
+        assert chunked.status_code == 413
+
+        malformed = client.post(
+            "/process",
+            content=small,
+            headers={"content-length": "abc"},
+        )
+        assert malformed.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_coalesce_frames(self):
+        """Frames within the window are merged, idle gaps flush a batch."""
+
+        async def frames():
+            yield b"a"
+            yield b"b"
+            await asyncio.sleep(0.05)
+            yield b"c" * 8
+            yield b"d"
+
+        merged = [
+            frame
+            async for frame in fastapi_factory._coalesce_frames(
+                frames(),
+                window=0.01,
+                max_bytes=8,
+            )
+        ]
+
+        assert merged == [b"ab", b"cccccccc", b"d"]
+
+    def test_create_app_custom_func_pool(self):
+        """Only the io and cpu custom function pools are accepted."""
+        app = FastAPIAppFactory.create_app(custom_func_pool="cpu")
+        assert app.state.custom_func_pool == "cpu"
+        assert app.state.custom_func_executor is None
+
+        with pytest.raises(ValueError):
+            FastAPIAppFactory.create_app(custom_func_pool="gpu")
+
+    @pytest.mark.asyncio
+    async def test_call_custom_function_keeps_context(self):
+        """Sync functions on the shared pool see the caller's context."""
+        import contextvars
+
+        request_var = contextvars.ContextVar("request_var", default=None)
+
+        def func(user_id, request, request_id):
+            return request_var.get(), request
+
+        request_var.set("from-caller")
+        result = await FastAPIAppFactory._call_custom_function(
+            func,
+            {"input": []},
+        )
+
+        assert result == ("from-caller", {"input": []})
+
+    @pytest.mark.parametrize("value", ["0", "-1", "four"])
+    def test_custom_func_workers_invalid(self, monkeypatch, value):
+        """CUSTOM_FUNC_WORKERS is validated when the pool is created."""
+
+        monkeypatch.setenv("CUSTOM_FUNC_WORKERS", value)
+        with pytest.raises(ValueError, match="CUSTOM_FUNC_WORKERS"):
+            fastapi_factory._custom_func_workers()
+
+    @pytest.mark.asyncio
+    async def test_custom_func_cpu_pool(self, mocker):
+        """With the cpu pool, a sync func runs in a worker process."""
+        app = FastAPIAppFactory.create_app(
+            func=_worker_pid,
+            runner=mocker.AsyncMock(),
+            custom_func_pool="cpu",
+        )
+        await FastAPIAppFactory._handle_startup(
+            app,
+            DeploymentMode.DAEMON_THREAD,
+            None,
+            None,
+        )
+        executor = app.state.custom_func_executor
+        try:
+            assert executor is app.state.stream_target.custom_func_executor
+            pid, request = await FastAPIAppFactory._call_custom_function(
+                _worker_pid,
+                {"input": []},
+                executor,
+            )
+        finally:
+            await FastAPIAppFactory._handle_shutdown(app, None)
+
+        assert pid != os.getpid()
+        assert request == {"input": []}
+        assert app.state.custom_func_executor is None
+
+    @pytest.mark.asyncio
+    async def test_stream_admission_limit(self):
+        """Streams beyond the limit wait until a slot frees up."""
+
+        admission = fastapi_factory._StreamAdmission(1)
+        await admission.acquire()
+
+        waiter = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await admission.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert admission.active == 2
+
+        await admission.release()
+        await admission.release()
+        assert admission.active == 0
+
+        with pytest.raises(ValueError):
+            await admission.set_limit(0)
+
+    @pytest.mark.asyncio
+    async def test_stream_target_resolved_after_before_start(self, mocker):
+        """A runner installed by before_start is the one streamed from."""
+        replacement = mocker.AsyncMock()
+
+        def before_start(app, **kwargs):
+            app.state.runner = replacement
+
+        app = FastAPIAppFactory.create_app(runner=mocker.AsyncMock())
+        await FastAPIAppFactory._handle_startup(
+            app,
+            DeploymentMode.DAEMON_THREAD,
+            None,
+            before_start,
+        )
+
+        assert app.state.stream_target.stream_query is (
+            replacement.stream_query
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_admission_unbounded(self):
+        """Without a limit, streams are admitted without waiting."""
+
+        app = FastAPIAppFactory.create_app()
+        assert app.state.max_streams is None
+
+        admission = fastapi_factory._StreamAdmission(None)
+        for _ in range(256):
+            await asyncio.wait_for(admission.acquire(), timeout=1)
+        assert admission.active == 256
+
+        await admission.set_limit(1)
+        await admission.set_limit(None)
+        await asyncio.wait_for(admission.acquire(), timeout=1)
+        assert admission.limit is None
+
 
 class TestFastAPITemplateManager:
     """Test cases for FastAPITemplateManager class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_template_manager_creation(self):
         """Test FastAPITemplateManager creation."""
         manager = FastAPITemplateManager()
@@ -180,13 +528,41 @@ class TestFastAPITemplateManager:
 class TestProcessManager:
     """Test cases for ProcessManager class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def virtual_clock(self, mocker):
+        """Make asyncio.sleep() advance the event loop clock instead of
+        waiting, so polling timeouts are covered in no real time."""
+        offset = [0.0]
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, result=None):
+            offset[0] += delay
+            return await real_sleep(0, result)
+
+        mocker.patch.object(
+            asyncio.BaseEventLoop,
+            "time",
+            lambda self: time.monotonic() + offset[0],
+        )
+        mocker.patch("asyncio.sleep", fake_sleep)
+        return offset
+
+    @pytest.fixture
+    def mock_sock(self, mocker, request):
+        """Patch the sockets opened by ProcessManager, connect_ex returns
+        the parametrized value (0, i.e. success, by default).
+
+        Only the module's own reference is patched, the event loop set up
+        after this fixture still needs real sockets.
+        """
+        mock_socket = mocker.patch(
+            "agentscope_runtime.engine.deployers.utils.service_utils."
+            "process_manager.socket",
+        ).socket
+        sock = mocker.Mock()
+        sock.connect_ex.return_value = getattr(request, "param", 0)
+        mock_socket.return_value.__enter__.return_value = sock
+        return sock
 
     def test_process_manager_creation(self):
         """Test ProcessManager creation."""
@@ -200,11 +576,16 @@ class TestProcessManager:
         assert custom_manager.shutdown_timeout == 60
 
     @pytest.mark.asyncio
-    async def test_start_detached_process(self, mocker):
+    async def test_start_detached_process(
+        self,
+        mocker,
+        tmp_path,
+        virtual_clock,
+    ):
         mock_popen = mocker.patch("subprocess.Popen")
         """Test starting a detached process."""
         # Create a test script
-        script_path = os.path.join(self.temp_dir, "test_script.py")
+        script_path = os.path.join(tmp_path, "test_script.py")
         with open(script_path, "w", encoding="utf-8") as f:
             f.write("print('Hello World')")
 
@@ -228,9 +609,9 @@ class TestProcessManager:
         assert "python" in call_args[0][0]
         assert script_path in call_args[0][0]
 
-    def test_create_pid_file(self):
+    def test_create_pid_file(self, tmp_path):
         """Test creating PID file."""
-        pid_file = os.path.join(self.temp_dir, "test.pid")
+        pid_file = os.path.join(tmp_path, "test.pid")
         manager = ProcessManager()
 
         manager.create_pid_file(12345, pid_file)
@@ -240,9 +621,9 @@ class TestProcessManager:
             content = f.read().strip()
             assert content == "12345"
 
-    def test_cleanup_pid_file(self):
+    def test_cleanup_pid_file(self, tmp_path):
         """Test cleaning up PID file."""
-        pid_file = os.path.join(self.temp_dir, "test.pid")
+        pid_file = os.path.join(tmp_path, "test.pid")
 
         # Create PID file
         with open(pid_file, "w", encoding="utf-8") as f:
@@ -264,33 +645,26 @@ class TestProcessManager:
         assert result is True
         mock_pid_exists.assert_called_once_with(12345)
 
+    @pytest.mark.parametrize(
+        "mock_sock, expected",
+        [(0, True), (1, False)],
+        ids=["available", "timeout"],
+        indirect=["mock_sock"],
+    )
     @pytest.mark.asyncio
-    async def test_wait_for_port(self, mocker):
-        mock_socket = mocker.patch("socket.socket")
-        """Test waiting for port to be available."""
-        # Mock successful connection
-        mock_sock = mocker.Mock()
-        mock_sock.connect_ex.return_value = 0  # Success
-        mock_socket.return_value.__enter__.return_value = mock_sock
-
+    async def test_wait_for_port(self, mock_sock, expected, virtual_clock):
+        """Test waiting for port to be available, or timing out."""
         manager = ProcessManager()
-        result = await manager.wait_for_port(
-            "127.0.0.1",
-            8000,
-            timeout=1,
-        )
+        result = await manager.wait_for_port("127.0.0.1", 8000, timeout=30)
 
-        assert result is True
+        assert result is expected
+        # Returns on the first successful probe, otherwise keeps polling
+        # every 0.5s until the timeout
+        assert (mock_sock.connect_ex.call_count == 1) is expected
 
     @pytest.mark.asyncio
-    async def test_wait_for_port_with_0_0_0_0(self, mocker):
+    async def test_wait_for_port_with_0_0_0_0(self, mock_sock):
         """Test waiting for port when host is 0.0.0.0."""
-        mock_socket = mocker.patch("socket.socket")
-        # Mock successful connection
-        mock_sock = mocker.Mock()
-        mock_sock.connect_ex.return_value = 0  # Success
-        mock_socket.return_value.__enter__.return_value = mock_sock
-
         manager = ProcessManager()
         result = await manager.wait_for_port(
             "0.0.0.0",
@@ -302,20 +676,6 @@ class TestProcessManager:
         assert result is True
         mock_sock.connect_ex.assert_called_with(("127.0.0.1", 8000))
 
-    @pytest.mark.asyncio
-    async def test_wait_for_port_timeout(self, mocker):
-        mock_socket = mocker.patch("socket.socket")
-        """Test waiting for port with timeout."""
-        # Mock failed connection
-        mock_sock = mocker.Mock()
-        mock_sock.connect_ex.return_value = 1  # Connection refused
-        mock_socket.return_value.__enter__.return_value = mock_sock
-
-        manager = ProcessManager()
-        result = await manager.wait_for_port("127.0.0.1", 8000, timeout=0.1)
-
-        assert result is False
-
     @pytest.mark.asyncio
     async def test_stop_process_gracefully(self, mocker):
         mock_pid_exists = mocker.patch("psutil.pid_exists")
@@ -167,6 +167,22 @@ class TestSessionHistoryServiceFactory:
             kwargs = SessionHistoryServiceFactory._load_env_kwargs("redis")
             assert not kwargs
 
+    def test_load_env_kwargs_follows_environ(self):
+        """Changes to the environment are picked up on the next call"""
+        with patch.dict(
+            os.environ,
+            {"SESSION_HISTORY_REDIS_URL": "redis://localhost:6379/0"},
+            clear=False,
+        ):
+            kwargs = SessionHistoryServiceFactory._load_env_kwargs("redis")
+            assert kwargs == {"url": "redis://localhost:6379/0"}
+
+            # Same number of variables, new matching one
+            del os.environ["SESSION_HISTORY_REDIS_URL"]
+            os.environ["SESSION_HISTORY_REDIS_PASSWORD"] = "secret"
+            kwargs = SessionHistoryServiceFactory._load_env_kwargs("redis")
+            assert kwargs == {"password": "secret"}
+
     @pytest.mark.asyncio
     async def test_default_backend_when_no_env(self):
         """Test default backend when no environment variables are present"""
@@ -186,3 +202,10 @@ class TestSessionHistoryServiceFactory:
             some_unused_param="hello",
         )
         assert isinstance(service, InMemorySessionHistoryService)
+
+    def test_create_sync(self):
+        """Test creating a service without awaiting"""
+        service = SessionHistoryServiceFactory.create_sync(
+            backend_type="in_memory",
+        )
+        assert isinstance(service, InMemorySessionHistoryService)
@@ -173,3 +173,23 @@ class TestStateServiceFactory:
             some_unused_param="hello",
         )
         assert isinstance(service, InMemoryStateService)
+
+    def test_backend_adapter(self):
+        """Test BackendAdapter defaults, filtering and conversion"""
+        from agentscope_runtime.engine.services.service_factory import (
+            BackendAdapter,
+        )
+
+        def ctor(**kwargs):
+            return kwargs
+
+        strict = BackendAdapter(ctor, defaults={"url": "a", "client": None})
+        assert strict(url="b", other=1) == {"url": "b", "client": None}
+
+        loose = BackendAdapter(
+            ctor,
+            defaults={"size": 10},
+            passthrough=True,
+            converters={"size": int},
+        )
+        assert loose(size="20", other=1) == {"size": 20, "other": 1}